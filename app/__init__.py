@@ -1,11 +1,14 @@
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from fastapi.middleware.cors import CORSMiddleware
-from app.routes import router
+# Imported first so startup timings are measured from package import
+from . import startup
 
 
-def create_app() -> FastAPI:
+def create_app():
     """Create and configure FastAPI application"""
+    # Imported here so that importing any app submodule stays cheap
+    from fastapi import FastAPI
+    from fastapi.staticfiles import StaticFiles
+    from fastapi.middleware.cors import CORSMiddleware
+    from app.routes import router
     
     app = FastAPI(title="AI Resume Builder", version="1.0")
     
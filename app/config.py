@@ -0,0 +1,141 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment"""
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting from the environment"""
+    value = os.getenv(name)
+    return value.strip().lower() in ("1", "true", "yes", "on") if value else default
+
+
+# Maximum number of LangGraph workflows running at the same time
+MAX_INFLIGHT_WORKFLOWS = _env_int("MAX_INFLIGHT_WORKFLOWS", 16)
+
+# Threads used for CPU-bound steps (text extraction, DOCX rendering)
+WORKER_POOL_SIZE = _env_int("WORKER_POOL_SIZE", min(8, (os.cpu_count() or 1) + 4))
+
+# Cache for LLM node results
+LLM_CACHE_ENABLED = _env_bool("LLM_CACHE_ENABLED", True)
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", "cache/results.sqlite3")
+LLM_CACHE_MEMORY_ENTRIES = _env_int("LLM_CACHE_MEMORY_ENTRIES", 512)
+LLM_CACHE_MAX_ENTRIES = _env_int("LLM_CACHE_MAX_ENTRIES", 50000)
+LLM_CACHE_TTL_SECONDS = _env_int("LLM_CACHE_TTL_SECONDS", 7 * 24 * 3600)
+
+# ATS scoring engine: "local" (deterministic keyword scorer) or "llm"
+ATS_SCORER = os.getenv("ATS_SCORER", "local").lower()
+
+# Processes used for batch text extraction
+PROCESS_POOL_SIZE = _env_int("PROCESS_POOL_SIZE", os.cpu_count() or 1)
+
+# Batch ingestion limits
+BATCH_CONCURRENCY = _env_int("BATCH_CONCURRENCY", 8)
+BATCH_MAX_FILES = _env_int("BATCH_MAX_FILES", 500)
+
+# Background job queue
+JOB_DB_PATH = os.getenv("JOB_DB_PATH", "data/jobs.sqlite3")
+JOB_WORKERS = _env_int("JOB_WORKERS", 4)
+
+# Upload limits
+MAX_UPLOAD_BYTES = _env_int("MAX_UPLOAD_BYTES", 10 * 1024 * 1024)
+MAX_ARCHIVE_BYTES = _env_int("MAX_ARCHIVE_BYTES", 500 * 1024 * 1024)
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
+
+# Keep a copy of single uploads on disk (text is extracted from memory either way)
+SAVE_UPLOADS = _env_bool("SAVE_UPLOADS", False)
+
+# PDF extraction limits
+PDF_MAX_PAGES = _env_int("PDF_MAX_PAGES", 50)
+PDF_TIMEOUT_SECONDS = _env_int("PDF_TIMEOUT_SECONDS", 30)
+PDF_PARALLEL_MIN_PAGES = _env_int("PDF_PARALLEL_MIN_PAGES", 16)
+
+# Cache for extracted upload text
+EXTRACTION_CACHE_ENABLED = _env_bool("EXTRACTION_CACHE_ENABLED", True)
+EXTRACTION_CACHE_MEMORY_ENTRIES = _env_int("EXTRACTION_CACHE_MEMORY_ENTRIES", 128)
+EXTRACTION_CACHE_MAX_ENTRIES = _env_int("EXTRACTION_CACHE_MAX_ENTRIES", 20000)
+EXTRACTION_CACHE_TTL_SECONDS = _env_int("EXTRACTION_CACHE_TTL_SECONDS", 30 * 24 * 3600)
+
+# Raw text compaction before the parse prompt
+COMPACTION_ENABLED = _env_bool("COMPACTION_ENABLED", True)
+PARSE_TOKEN_BUDGET = _env_int("PARSE_TOKEN_BUDGET", 6000)
+
+# Score and enhance with one LLM call instead of two
+FUSED_ATS_ENHANCE = _env_bool("FUSED_ATS_ENHANCE", False)
+
+# Enhance sections concurrently when a resume has at least this many parts
+ENHANCE_FANOUT_MIN_SECTIONS = _env_int("ENHANCE_FANOUT_MIN_SECTIONS", 6)
+
+# Shared LLM dispatcher: batch size and extra wait for grouping calls (0 only
+# groups calls made together) and provider quotas, off (0) unless set, e.g.
+# 30 requests / 6000 tokens for Groq's free tier
+LLM_MAX_BATCH = _env_int("LLM_MAX_BATCH", 8)
+LLM_BATCH_WINDOW_MS = _env_int("LLM_BATCH_WINDOW_MS", 0)
+LLM_REQUESTS_PER_MINUTE = _env_int("LLM_REQUESTS_PER_MINUTE", 0)
+LLM_TOKENS_PER_MINUTE = _env_int("LLM_TOKENS_PER_MINUTE", 0)
+LLM_COMPLETION_TOKEN_ESTIMATE = _env_int("LLM_COMPLETION_TOKEN_ESTIMATE", 512)
+
+# LLM resilience: timeouts, retries, hedging and circuit breaking
+LLM_TIMEOUT_SECONDS = _env_int("LLM_TIMEOUT_SECONDS", 30)
+LLM_NODE_TIMEOUTS = {
+    node: _env_int(f"LLM_TIMEOUT_{node.upper()}", default)
+    for node, default in {
+        "parse": 30,
+        "ats": 20,
+        "enhance": 45,
+        "enhance_section": 20,
+        "ats_enhance": 45
+    }.items()
+}
+LLM_MAX_RETRIES = _env_int("LLM_MAX_RETRIES", 2)
+LLM_HEDGE_ENABLED = _env_bool("LLM_HEDGE_ENABLED", True)
+LLM_HEDGE_MIN_SAMPLES = _env_int("LLM_HEDGE_MIN_SAMPLES", 20)
+LLM_BREAKER_THRESHOLD = _env_int("LLM_BREAKER_THRESHOLD", 5)
+LLM_BREAKER_COOLDOWN_SECONDS = _env_int("LLM_BREAKER_COOLDOWN_SECONDS", 30)
+
+# LLM provider: "groq" or "stub" (deterministic offline model for benchmarks and local runs)
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "groq").lower()
+STUB_LLM_LATENCY_MS = _env_int("STUB_LLM_LATENCY_MS", 0)
+STUB_LLM_RESPONSES = os.getenv("STUB_LLM_RESPONSES", "")
+
+# Build the LLM client, compile the graphs and open the provider connection at startup
+WARMUP_ON_STARTUP = _env_bool("WARMUP_ON_STARTUP", False)
+
+# DOCX templates: built-ins plus any <name>.docx found in TEMPLATE_DIR
+TEMPLATE_DIR = os.getenv("TEMPLATE_DIR", "templates")
+DEFAULT_TEMPLATE = os.getenv("DEFAULT_TEMPLATE", "modern")
+
+# Rendered documents: kept in memory for download and optionally written to outputs/
+PERSIST_OUTPUTS = _env_bool("PERSIST_OUTPUTS", True)
+RENDER_STORE_MAX_BYTES = _env_int("RENDER_STORE_MAX_BYTES", 64 * 1024 * 1024)
+RENDER_HANDLE_TTL_SECONDS = _env_int("RENDER_HANDLE_TTL_SECONDS", 600)
+
+# Render cache: identical resume + template reuse the rendered document
+RENDER_CACHE_ENABLED = _env_bool("RENDER_CACHE_ENABLED", True)
+RENDER_CACHE_MAX_BYTES = _env_int("RENDER_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+
+# Artifact storage quotas, enforced by a background sweeper
+OUTPUT_DIR = os.getenv("OUTPUT_DIR", "outputs")
+UPLOAD_QUOTA_BYTES = _env_int("UPLOAD_QUOTA_BYTES", 2 * 1024 * 1024 * 1024)
+UPLOAD_MAX_AGE_SECONDS = _env_int("UPLOAD_MAX_AGE_SECONDS", 7 * 24 * 3600)
+OUTPUT_QUOTA_BYTES = _env_int("OUTPUT_QUOTA_BYTES", 1024 * 1024 * 1024)
+OUTPUT_MAX_AGE_SECONDS = _env_int("OUTPUT_MAX_AGE_SECONDS", 24 * 3600)
+ARTIFACT_SWEEP_INTERVAL_SECONDS = _env_int("ARTIFACT_SWEEP_INTERVAL_SECONDS", 300)
+DOWNLOAD_CACHE_SECONDS = _env_int("DOWNLOAD_CACHE_SECONDS", 24 * 3600)
+
+# Re-enhance only sections whose content changed since an earlier request
+INCREMENTAL_ENHANCE = _env_bool("INCREMENTAL_ENHANCE", True)
+
+# Prometheus metrics at /metrics: request, node, LLM and extraction timings
+METRICS_ENABLED = _env_bool("METRICS_ENABLED", True)
+
+# Per-request profiling, requested with the X-Profile header or ?profile=1;
+# writes CPU profiles, allocation diffs and a step breakdown to PROFILE_DIR
+PROFILING_ENABLED = _env_bool("PROFILING_ENABLED", False)
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
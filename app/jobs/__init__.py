@@ -0,0 +1,4 @@
+from .store import JobStore
+from .queue import JobQueue
+
+__all__ = ["JobStore", "JobQueue"]
@@ -0,0 +1,74 @@
+import asyncio
+import os
+from app.utils import workflow_slot
+from .store import JobStore
+
+
+class JobQueue:
+    """Local worker pool that runs queued resume jobs through the workflow"""
+
+    def __init__(self, store: JobStore, get_graph, build_state, workers: int = 4):
+        self.store = store
+        self.get_graph = get_graph
+        self.build_state = build_state
+        self.workers = workers
+        self._queue = None
+        self._tasks = []
+
+    async def start(self):
+        """Open the store, re-queue unfinished jobs and start the workers"""
+        await self.store.open()
+        self._queue = asyncio.Queue()
+        for job_id in await self.store.unfinished():
+            self._queue.put_nowait(job_id)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Stop the workers; running jobs are picked up again on next start"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.store.close()
+
+    async def submit(self, payload: dict) -> str:
+        """Persist a job and queue it, returning the job ID immediately"""
+        job_id = await self.store.create(payload)
+        self._queue.put_nowait(job_id)
+        return job_id
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str):
+        job = await self.store.get(job_id)
+        if job is None or job["status"] not in ("queued", "running"):
+            return
+
+        await self.store.mark_running(job_id)
+        try:
+            state = await self.build_state(job["payload"])
+            progress = []
+            async with workflow_slot():
+                async for update in self.get_graph().astream(state, stream_mode="updates"):
+                    for node, node_state in update.items():
+                        if node_state:
+                            state.update(node_state)
+                        progress.append(node)
+                    await self.store.set_progress(job_id, progress)
+
+            await self.store.complete(job_id, {
+                "parsed_data": state["parsed_data"],
+                "ats_score": state["ats_score"],
+                "enhanced_data": state["enhanced_data"],
+                "output_file": os.path.basename(state["output_file"])
+            })
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self.store.fail(job_id, str(e))
@@ -0,0 +1,96 @@
+import json
+import os
+import time
+import uuid
+import aiosqlite
+
+
+class JobStore:
+    """SQLite-backed store for background resume jobs"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db = None
+
+    async def open(self):
+        """Open the database and create the jobs table"""
+        if self._db is not None:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._db = await aiosqlite.connect(self.path)
+        self._db.row_factory = aiosqlite.Row
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        await self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                progress TEXT NOT NULL DEFAULT '[]',
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        await self._db.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status)")
+        await self._db.commit()
+
+    async def close(self):
+        """Close the database"""
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+    async def _update(self, job_id: str, **fields):
+        fields["updated_at"] = time.time()
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        await self._db.execute(
+            f"UPDATE jobs SET {columns} WHERE id = ?",
+            (*fields.values(), job_id)
+        )
+        await self._db.commit()
+
+    async def create(self, payload: dict) -> str:
+        """Store a new queued job and return its ID"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        await self._db.execute(
+            "INSERT INTO jobs (id, status, payload, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (job_id, "queued", json.dumps(payload), now, now)
+        )
+        await self._db.commit()
+        return job_id
+
+    async def get(self, job_id: str) -> dict:
+        """Return a job as a dict, or None if it does not exist"""
+        async with self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["progress"] = json.loads(job["progress"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    async def mark_running(self, job_id: str):
+        await self._update(job_id, status="running", progress="[]", error=None)
+
+    async def set_progress(self, job_id: str, progress: list):
+        await self._update(job_id, progress=json.dumps(progress))
+
+    async def complete(self, job_id: str, result: dict):
+        await self._update(job_id, status="succeeded", result=json.dumps(result))
+
+    async def fail(self, job_id: str, error: str):
+        await self._update(job_id, status="failed", error=error)
+
+    async def unfinished(self) -> list:
+        """Return IDs of queued or interrupted jobs, oldest first"""
+        async with self._db.execute(
+            "SELECT id FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return [row["id"] for row in rows]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from typing_extensions import TypedDict
 
 class ResumeData(BaseModel):
@@ -12,6 +12,13 @@ class ResumeData(BaseModel):
     education: List[dict]
     skills: List[str]
     projects: Optional[List[dict]] = []
+    job_description: Optional[str] = ""
+    template: Optional[str] = ""
+
+
+def merge_dicts(left: dict, right: dict) -> dict:
+    """Reducer that merges dict updates from parallel workflow branches"""
+    return {**(left or {}), **(right or {})}
 
 
 class ResumeState(TypedDict):
@@ -22,3 +29,6 @@ class ResumeState(TypedDict):
     enhanced_data: dict
     template: str
     output_file: str
+    job_description: str
+    compaction: dict
+    enhanced_sections: Annotated[dict, merge_dicts]
@@ -1,15 +1,61 @@
 import os
+import re
 import json
-from fastapi import APIRouter, File, UploadFile, FastAPI
-from fastapi.responses import FileResponse, JSONResponse
+import logging
+import uuid
+import hashlib
+import asyncio
+import shutil
+import time
+import zipfile
+from functools import partial
+from typing import List
+from contextlib import asynccontextmanager, nullcontext
+from fastapi import APIRouter, File, Form, Request, UploadFile, FastAPI
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
+from app import config
+from app.startup import mark_ready, startup_report, timed_stage
+from app.jobs import JobQueue, JobStore
 from app.models import ResumeData
-from app.utils import extract_text_from_pdf, extract_text_from_docx
-from app.workflow import build_workflow
+from app.utils import run_in_worker, run_in_process, workflow_slot
+from app.utils.docx_templates import get_template, list_templates, load_templates
+from app.utils.extraction_cache import extraction_cache, extract_cached
+from app.utils.render_cache import render_cache, render_cached
+from app.utils.render_store import DOCX_MEDIA_TYPE, render_store
+from app.utils.resume_generator import download_name
+from app.utils.artifacts import artifact_name, output_store, run_sweeper, upload_store
+from app.utils import metrics
+from app.utils.profiling import PROFILE_ID_HEADER, profile_config, request_profile
+from app.utils.uploads import UploadRejected, store_upload, RESUME_TYPES
+from app.workflow.llm_cache import llm_cache, section_cache
+from app.workflow.llm_config import get_chat_model, get_llm, get_resilient_model
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from starlette.routing import Match
 
 
-router = FastAPI(title="AI Resume Builder", version="1.0")
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background workers and release resources on shutdown"""
+    await job_queue.start()
+    sweeper = asyncio.create_task(
+        run_sweeper([upload_store, output_store], config.ARTIFACT_SWEEP_INTERVAL_SECONDS)
+    )
+    if config.WARMUP_ON_STARTUP:
+        await warm_up()
+    mark_ready()
+    yield
+    sweeper.cancel()
+    await job_queue.stop()
+    await llm_cache.close()
+    await section_cache.close()
+    await extraction_cache.close()
+
+
+router = FastAPI(title="AI Resume Builder", version="1.0", lifespan=lifespan)
 router.mount("/static", StaticFiles(directory="static"), name="static")
 router.add_middleware(
     CORSMiddleware,
@@ -20,8 +66,84 @@ router.add_middleware(
 )
 
 
-# Build the workflow once
-graph = build_workflow()
+def _route_template(request: Request) -> str:
+    """Path template of the matching route, so metric labels stay bounded"""
+    for route in request.app.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, "path", request.url.path)
+    return "unmatched"
+
+
+if config.METRICS_ENABLED:
+    @router.middleware("http")
+    async def record_request_metrics(request: Request, call_next):
+        """Time each request by method, route template and status"""
+        route = _route_template(request)
+        started = time.perf_counter()
+        status = 500
+        metrics.http_requests_in_flight.inc()
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            metrics.http_requests_in_flight.dec()
+            labels = {"method": request.method, "route": route, "status": status}
+            metrics.http_request_duration.observe(time.perf_counter() - started, **labels)
+            if status >= 400:
+                metrics.http_errors.inc(**labels)
+
+
+# Workflow variants, compiled on first use (or during warm-up)
+_graphs = {}
+
+
+def get_graph(render: bool = True):
+    """Return the compiled workflow, building it on first use"""
+    if render not in _graphs:
+        from app.workflow import build_workflow
+        _graphs[render] = build_workflow(render=render, fused=config.FUSED_ATS_ENHANCE)
+    return _graphs[render]
+
+
+async def warm_up():
+    """Load the LLM stack, compile the graphs and connect to the provider"""
+    with timed_stage("compile_graphs"):
+        get_graph()
+        get_graph(render=False)
+    with timed_stage("llm_client"):
+        get_llm()
+    with timed_stage("templates"):
+        await run_in_worker(load_templates)
+    with timed_stage("extractors"):
+        from app.utils import file_handlers, resume_generator
+    with timed_stage("provider_connection"):
+        from app.workflow.providers import warm_up_chat_model
+        try:
+            await warm_up_chat_model(get_chat_model())
+        except Exception as e:
+            # A failed warm-up only costs the first request its connection setup
+            logger.warning("LLM warm-up failed: %s", e)
+
+
+async def _job_initial_state(payload: dict) -> dict:
+    """Build the workflow state for a queued upload job"""
+    extraction = await extract_cached(payload["file_path"], payload.get("file_type"), payload.get("sha256"))
+    raw_text = extraction["text"]
+    return _initial_state(
+        raw_text,
+        job_description=payload.get("job_description", ""),
+        template=payload.get("template")
+    )
+
+
+job_queue = JobQueue(
+    JobStore(config.JOB_DB_PATH),
+    get_graph,
+    _job_initial_state,
+    workers=config.JOB_WORKERS
+)
 
 
 @router.get("/")
@@ -30,135 +152,550 @@ async def root():
     return FileResponse("static/index.html")
 
 
+async def _extract_upload_text(file: UploadFile) -> str:
+    """Validate an uploaded resume and extract its text, saving it only if configured"""
+    upload = await store_upload(file, persist=config.SAVE_UPLOADS)
+    
+    # Extract text based on file type, reusing earlier extractions of the same file
+    extraction = await extract_cached(upload.source, upload.extension, upload.sha256)
+    return extraction["text"]
+
+
+def _error_response(e: Exception) -> JSONResponse:
+    """Turn an exception into the API's JSON error response"""
+    return JSONResponse({"error": str(e)}, status_code=getattr(e, "status_code", 400))
+
+
+def _with_profile_id(response: Response, profile) -> Response:
+    """Tell the caller where a profiled request's results were written"""
+    if profile is not None:
+        response.headers[PROFILE_ID_HEADER] = profile.id
+    return response
+
+
+async def _check_template(template: str) -> str:
+    """Normalize a requested template name, rejecting unknown templates"""
+    template = (template or config.DEFAULT_TEMPLATE).lower()
+    # The first call loads and parses the templates, so keep it off the event loop
+    await run_in_worker(get_template, template)
+    return template
+
+
+def _initial_state(
+    raw_text: str = "",
+    parsed_data: dict = None,
+    job_description: str = "",
+    template: str = None
+) -> dict:
+    """Create the initial workflow state"""
+    return {
+        "raw_text": raw_text,
+        "parsed_data": parsed_data or {},
+        "ats_score": {},
+        "enhanced_data": {},
+        "template": template or config.DEFAULT_TEMPLATE,
+        "output_file": "",
+        "job_description": job_description,
+        "compaction": {}
+    }
+
+
+# Node name -> (SSE event name, state key) pairs it produces
+STREAM_EVENTS = {
+    "compact": [("compaction", "compaction")],
+    "parse": [("parsed_data", "parsed_data")],
+    "ats_score_analysis": [("ats_score", "ats_score")],
+    "enhance": [("enhanced_data", "enhanced_data")],
+    "reuse_sections": [("reused_sections", "enhanced_sections")],
+    "enhance_section": [("section", "enhanced_sections")],
+    "merge_sections": [("enhanced_data", "enhanced_data")],
+    "ats_enhance": [("ats_score", "ats_score"), ("enhanced_data", "enhanced_data")],
+    "generate": [("output_file", "output_file")]
+}
+
+
+def _sse(event: str, data) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _stream_workflow(workflow, initial_state: dict):
+    """Run a workflow and yield one SSE event per finished node"""
+    try:
+        async with workflow_slot():
+            async for update in workflow.astream(initial_state, stream_mode="updates"):
+                for node, node_state in update.items():
+                    if node not in STREAM_EVENTS or not node_state:
+                        continue
+                    for event, key in STREAM_EVENTS[node]:
+                        value = node_state[key]
+                        if key == "output_file":
+                            value = os.path.basename(value)
+                        yield _sse(event, value)
+        yield _sse("done", {"status": "success"})
+    except Exception as e:
+        yield _sse("error", {"error": str(e)})
+
+
+def _event_stream(events) -> StreamingResponse:
+    """Wrap an SSE generator in a non-buffered streaming response"""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post("/api/upload")
-async def upload_resume(file: UploadFile = File(...)):
+async def upload_resume(
+    request: Request,
+    file: UploadFile = File(...),
+    job_description: str = Form(""),
+    template: str = Form("")
+):
     """Upload and process resume file"""
+    profile = request_profile(request, "upload")
     try:
-        # Create uploads folder
-        os.makedirs("uploads", exist_ok=True)
-        filepath = f"uploads/{file.filename}"
-        
-        # Save file
-        with open(filepath, "wb") as f:
-            content = await file.read()
-            f.write(content)
-        
-        # Extract text based on file type
-        if file.filename.endswith(".pdf"):
-            raw_text = extract_text_from_pdf(filepath)
-        elif file.filename.endswith(".docx"):
-            raw_text = extract_text_from_docx(filepath)
-        else:
-            return JSONResponse({"error": "Unsupported file format"}, status_code=400)
-        
-        # Create initial state
-        initial_state = {
-            "raw_text": raw_text,
-            "parsed_data": {},
-            "ats_score": {},
-            "enhanced_data": {},
-            "template": "modern",
-            "output_file": ""
-        }
-        
-        # Run the workflow
-        result = graph.invoke(initial_state)
+        template = await _check_template(template)
+        async with profile or nullcontext():
+            raw_text = await _extract_upload_text(file)
+            
+            # Create initial state
+            initial_state = _initial_state(raw_text, job_description=job_description, template=template)
+            
+            # Run the workflow
+            async with workflow_slot():
+                result = await get_graph().ainvoke(initial_state, profile_config(profile))
         
         # Extract filename from full path
         output_filename = os.path.basename(result["output_file"])
         
-        return JSONResponse({
+        return _with_profile_id(JSONResponse({
             "status": "success",
             "parsed_data": result["parsed_data"],
             "ats_score": result["ats_score"],
-            "output_file": output_filename
-        })
+            "output_file": output_filename,
+            "compaction": result.get("compaction", {})
+        }), profile)
     
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=400)
+        return _with_profile_id(_error_response(e), profile)
 
 
-@router.post("/api/process-manual")
-async def process_manual_resume(data: ResumeData):
-    """Process manually entered resume data"""
+@router.post("/api/upload/stream")
+async def upload_resume_stream(
+    file: UploadFile = File(...),
+    job_description: str = Form(""),
+    template: str = Form("")
+):
+    """Upload a resume and stream each workflow step as server-sent events"""
     try:
-        raw_text = f"""
-        Name: {data.name}
-        Email: {data.email}
-        Phone: {data.phone}
-        
-        Summary: {data.summary}
+        template = await _check_template(template)
+        raw_text = await _extract_upload_text(file)
+    except Exception as e:
+        return _error_response(e)
+    
+    initial_state = _initial_state(raw_text, job_description=job_description, template=template)
+    return _event_stream(_stream_workflow(get_graph(), initial_state))
+
+
+BATCH_EXTENSIONS = (".pdf", ".docx")
+
+
+def _unpack_batch_archive(archive_path: str, dest_dir: str, limit: int) -> list:
+    """Extract the PDF/DOCX members of a zip archive into dest_dir"""
+    files = []
+    with zipfile.ZipFile(archive_path) as archive:
+        for member in archive.infolist():
+            name = os.path.basename(member.filename)
+            if member.is_dir() or not name.lower().endswith(BATCH_EXTENSIONS):
+                continue
+            if member.file_size > config.MAX_UPLOAD_BYTES:
+                files.append((member.filename, None, None))
+                continue
+            if len(files) >= limit:
+                raise UploadRejected(f"Batch exceeds the limit of {limit} files", 413)
+            # Flatten paths and prefix an index so members never collide
+            path = os.path.join(dest_dir, f"{len(files)}_{name}")
+            digest = hashlib.sha256()
+            with archive.open(member) as src, open(path, "wb") as dst:
+                while chunk := src.read(1024 * 1024):
+                    digest.update(chunk)
+                    dst.write(chunk)
+            files.append((member.filename, path, digest.hexdigest()))
+    return files
+
+
+async def _save_batch_files(files: List[UploadFile], batch_dir: str) -> list:
+    """Save batch uploads to disk, expanding zip archives"""
+    saved = []
+    for file in files:
+        upload = await store_upload(
+            file,
+            allowed=RESUME_TYPES + ("zip",),
+            max_bytes=config.MAX_ARCHIVE_BYTES if file.filename.lower().endswith(".zip") else None,
+            directory=batch_dir
+        )
         
-        Experience: {json.dumps(data.experience)}
-        Education: {json.dumps(data.education)}
-        Skills: {', '.join(data.skills)}
-        Projects: {json.dumps(data.projects)}
-        """
+        if upload.extension == "zip":
+            remaining = config.BATCH_MAX_FILES - len(saved)
+            saved.extend(await run_in_worker(_unpack_batch_archive, upload.path, batch_dir, remaining))
+            os.remove(upload.path)
+        else:
+            saved.append((file.filename, upload.path, upload.sha256))
         
-        initial_state = {
-            "raw_text": raw_text,
-            "parsed_data": data.dict(),
-            "ats_score": {},
-            "enhanced_data": {},
-            "template": "modern",
-            "output_file": ""
-        }
+        if len(saved) > config.BATCH_MAX_FILES:
+            raise UploadRejected(f"Batch exceeds the limit of {config.BATCH_MAX_FILES} files", 413)
+    return saved
+
+
+async def _process_batch_file(
+    name: str,
+    path: str,
+    sha256: str,
+    template: str,
+    semaphore: asyncio.Semaphore
+) -> dict:
+    """Extract and process one batch file, reporting errors instead of raising"""
+    # The hard limit gives the worker's own PDF deadline a second to fire first
+    run_extraction = partial(run_in_process, timeout=config.PDF_TIMEOUT_SECONDS + 1)
+    async with semaphore:
+        try:
+            if path is None:
+                raise UploadRejected(f"File exceeds the maximum size of {config.MAX_UPLOAD_BYTES} bytes", 413)
+            extraction = await extract_cached(path, None, sha256, run=run_extraction)
+            raw_text = extraction["text"]
+            async with workflow_slot():
+                result = await get_graph().ainvoke(_initial_state(raw_text, template=template))
+            return {
+                "file": name,
+                "status": "success",
+                "parsed_data": result["parsed_data"],
+                "ats_score": result["ats_score"],
+                "output_file": os.path.basename(result["output_file"])
+            }
+        except Exception as e:
+            return {"file": name, "status": "error", "error": str(e)}
+
+
+async def _batch_results(files: list, template: str, batch_dir: str):
+    """Yield one NDJSON line per file as soon as it finishes, then remove the batch files"""
+    semaphore = asyncio.Semaphore(config.BATCH_CONCURRENCY)
+    tasks = [
+        asyncio.create_task(_process_batch_file(name, path, sha256, template, semaphore))
+        for name, path, sha256 in files
+    ]
+    succeeded = 0
+    try:
+        for finished in asyncio.as_completed(tasks):
+            result = await finished
+            succeeded += result["status"] == "success"
+            yield json.dumps(result) + "\n"
+        yield json.dumps({
+            "status": "done",
+            "total": len(files),
+            "succeeded": succeeded,
+            "failed": len(files) - succeeded
+        }) + "\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+        await run_in_worker(shutil.rmtree, batch_dir, ignore_errors=True)
+
+
+@router.post("/api/upload/batch")
+async def upload_resume_batch(files: List[UploadFile] = File(...), template: str = Form("")):
+    """Process many resumes (PDF, DOCX or zip archives), streaming results as NDJSON"""
+    # Batch files are scratch data; whatever is left behind on errors is swept by age
+    batch_dir = os.path.join(upload_store.temp_dir(), f"batch_{uuid.uuid4().hex}")
+    try:
+        template = await _check_template(template)
+        saved = await _save_batch_files(files, batch_dir)
+    except Exception as e:
+        await run_in_worker(shutil.rmtree, batch_dir, ignore_errors=True)
+        return _error_response(e)
+    
+    return StreamingResponse(_batch_results(saved, template, batch_dir), media_type="application/x-ndjson")
+
+
+@router.post("/api/jobs")
+async def submit_resume_job(
+    file: UploadFile = File(...),
+    job_description: str = Form(""),
+    template: str = Form("")
+):
+    """Queue a resume for background processing and return its job ID"""
+    try:
+        template = await _check_template(template)
+        upload = await store_upload(file)
+        job_id = await job_queue.submit({
+            "file_path": upload.path,
+            "file_type": upload.extension,
+            "sha256": upload.sha256,
+            "job_description": job_description,
+            "template": template
+        })
+        return JSONResponse({"status": "queued", "job_id": job_id}, status_code=202)
+    except Exception as e:
+        return _error_response(e)
+
+
+@router.get("/api/jobs/{job_id}")
+async def get_resume_job(job_id: str):
+    """Report job status and which workflow nodes have finished"""
+    job = await job_queue.store.get(job_id)
+    if job is None:
+        return JSONResponse({"error": "Job not found"}, status_code=404)
+    return {
+        "job_id": job_id,
+        "status": job["status"],
+        "progress": job["progress"],
+        "error": job["error"],
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"]
+    }
+
+
+@router.get("/api/jobs/{job_id}/result")
+async def get_resume_job_result(job_id: str):
+    """Return the result of a finished job"""
+    job = await job_queue.store.get(job_id)
+    if job is None:
+        return JSONResponse({"error": "Job not found"}, status_code=404)
+    if job["status"] == "failed":
+        return JSONResponse({"error": job["error"]}, status_code=400)
+    if job["status"] != "succeeded":
+        return JSONResponse({"status": job["status"], "progress": job["progress"]}, status_code=202)
+    return {"status": "success", **job["result"]}
+
+
+@router.post("/api/process-manual")
+async def process_manual_resume(request: Request, data: ResumeData):
+    """Process manually entered resume data"""
+    profile = request_profile(request, "process-manual")
+    try:
+        initial_state = _initial_state(
+            parsed_data=data.dict(exclude={"job_description", "template"}),
+            job_description=data.job_description or "",
+            template=await _check_template(data.template)
+        )
         
-        result = graph.invoke(initial_state)
+        async with workflow_slot():
+            async with profile or nullcontext():
+                result = await get_graph().ainvoke(initial_state, profile_config(profile))
         
         output_filename = os.path.basename(result["output_file"])
         
-        return JSONResponse({
+        return _with_profile_id(JSONResponse({
             "status": "success",
             "parsed_data": result["parsed_data"],
             "ats_score": result["ats_score"],
             "output_file": output_filename
-        })
+        }), profile)
     
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=400)
+        return _with_profile_id(_error_response(e), profile)
 
 
 @router.post("/api/enhance")
-async def enhance_resume(data: dict):
+async def enhance_resume(request: Request, data: dict):
     """Enhance existing resume"""
+    profile = request_profile(request, "enhance")
     try:
-        raw_text = json.dumps(data)
+        job_description = data.pop("job_description", "") or ""
         
-        initial_state = {
-            "raw_text": raw_text,
-            "parsed_data": data,
-            "ats_score": {},
-            "enhanced_data": {},
-            "template": "modern",
-            "output_file": ""
-        }
+        initial_state = _initial_state(parsed_data=data, job_description=job_description)
         
-        # Run workflow
-        result = graph.invoke(initial_state)
+        # Run workflow without parsing or rendering
+        async with workflow_slot():
+            async with profile or nullcontext():
+                result = await get_graph(render=False).ainvoke(initial_state, profile_config(profile))
         
-        return JSONResponse({
+        return _with_profile_id(JSONResponse({
             "status": "success",
             "enhanced_data": result["enhanced_data"],
             "ats_score": result["ats_score"]
-        })
+        }), profile)
     
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=400)
+        return _with_profile_id(_error_response(e), profile)
+
+
+@router.post("/api/enhance/stream")
+async def enhance_resume_stream(data: dict):
+    """Enhance existing resume, streaming each workflow step as server-sent events"""
+    job_description = data.pop("job_description", "") or ""
+    initial_state = _initial_state(parsed_data=data, job_description=job_description)
+    return _event_stream(_stream_workflow(get_graph(render=False), initial_state))
+
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _etag(name: str) -> str:
+    """Strong ETag of a content-addressed document: its SHA-256"""
+    return f'"{name.split(".")[0]}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """True when the client's If-None-Match already names this document"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _download_headers(name: str) -> dict:
+    """Caching headers for a document whose name is its content hash"""
+    return {
+        "ETag": _etag(name),
+        "Cache-Control": f"public, max-age={config.DOWNLOAD_CACHE_SECONDS}, immutable",
+        "Accept-Ranges": "bytes"
+    }
+
+
+def _byte_range(header: str, size: int):
+    """Parse a single "bytes=" range into inclusive (start, end), None to send everything"""
+    match = _RANGE_RE.match(header.strip())
+    if match is None or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    else:
+        start, end = max(size - int(last), 0), size - 1
+    if start > end or start >= size:
+        raise ValueError("Range not satisfiable")
+    return start, end
+
+
+def _docx_response(request: Request, document: bytes, name: str) -> Response:
+    """Send an in-memory resume, honouring If-None-Match and single Range requests"""
+    headers = _download_headers(name)
+    if _not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    headers["Content-Disposition"] = f'attachment; filename="{download_name(name)}"'
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() == headers["ETag"]):
+        try:
+            byte_range = _byte_range(range_header, len(document))
+        except ValueError:
+            return Response(status_code=416, headers={"Content-Range": f"bytes */{len(document)}"})
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(document)}"
+            return Response(document[start:end + 1], status_code=206, media_type=DOCX_MEDIA_TYPE, headers=headers)
+
+    return Response(document, media_type=DOCX_MEDIA_TYPE, headers=headers)
+
+
+@router.post("/api/render")
+async def render_resume(request: Request, data: dict, template: str = ""):
+    """Render resume data straight into the response, without the workflow or disk"""
+    try:
+        template = await _check_template(data.pop("template", "") or template)
+        document = await run_in_worker(render_cached, data, template)
+        return _docx_response(request, document, artifact_name(document, "docx"))
+    except Exception as e:
+        return _error_response(e)
 
 
 @router.get("/api/download/{filename}")
-async def download_resume(filename: str):
-    """Download generated resume"""
+async def download_resume(request: Request, filename: str):
+    """Download generated resume, from memory while its handle is live, else from the output store"""
     try:
-        filepath = f"outputs/{filename}"
-        if os.path.exists(filepath):
+        document = render_store.get(filename)
+        if document is not None:
+            return _docx_response(request, document, filename)
+        
+        filepath = await run_in_worker(output_store.find, filename)
+        if filepath is None:
+            return JSONResponse({"error": "File not found"}, status_code=404)
+        if output_store.path_for(filename) is None:
+            # Legacy timestamped outputs are not content-addressed
             return FileResponse(filepath, filename=filename)
-        return JSONResponse({"error": "File not found"}, status_code=404)
+        
+        headers = _download_headers(filename)
+        if _not_modified(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        return FileResponse(
+            filepath,
+            media_type=DOCX_MEDIA_TYPE,
+            filename=download_name(filename),
+            headers=headers
+        )
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=400)
 
 
+@router.get("/api/templates")
+async def templates():
+    """Available resume templates"""
+    return {"templates": await run_in_worker(list_templates), "default": config.DEFAULT_TEMPLATE}
+
+
+@router.get("/api/cache/stats")
+async def cache_stats():
+    """Cache hit/miss counters"""
+    return {
+        "llm": llm_cache.stats(),
+        "sections": section_cache.stats(),
+        "extraction": extraction_cache.stats(),
+        "render": render_cache.stats(),
+        "render_store": render_store.stats()
+    }
+
+
+@router.get("/api/storage/stats")
+async def storage_stats():
+    """Artifact store usage as of the last sweep"""
+    return {"uploads": upload_store.stats(), "outputs": output_store.stats()}
+
+
+@router.get("/api/llm/stats")
+async def llm_stats():
+    """Shared LLM dispatcher and resilience counters"""
+    return {"dispatcher": get_llm().stats(), "resilience": get_resilient_model().stats()}
+
+
+@metrics.registry.collector
+def _stats_metrics() -> list:
+    """Cache and storage counters already kept by their components"""
+    cache_hits = metrics.Counter("resume_cache_hits_total", "Cache hits", ("cache",))
+    cache_misses = metrics.Counter("resume_cache_misses_total", "Cache misses", ("cache",))
+    cache_evictions = metrics.Counter("resume_cache_evictions_total", "Cache evictions", ("cache",))
+    for name, cache in (("llm", llm_cache), ("sections", section_cache),
+                        ("extraction", extraction_cache), ("render", render_cache)):
+        stats = cache.stats()
+        cache_hits.inc(stats["hits"], cache=name)
+        cache_misses.inc(stats["misses"], cache=name)
+        cache_evictions.inc(stats["evictions"], cache=name)
+
+    storage = metrics.Gauge("resume_storage_bytes", "Artifact store size as of the last sweep", ("store",))
+    for name, store in (("uploads", upload_store), ("outputs", output_store)):
+        storage.set(store.stats()["bytes"], store=name)
+    storage.set(render_store.stats()["bytes"], store="memory")
+
+    return [cache_hits, cache_misses, cache_evictions, storage]
+
+
+@router.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus scrape endpoint"""
+    if not config.METRICS_ENABLED:
+        return JSONResponse(status_code=404, content={"detail": "Metrics are disabled"})
+    return PlainTextResponse(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@router.get("/api/startup")
+async def startup_stats():
+    """Startup stage timings of this worker"""
+    return startup_report()
+
+
 @router.get("/api/health")
 async def health():
     """Health check"""
@@ -0,0 +1,35 @@
+import sys
+import time
+from contextlib import contextmanager
+
+
+# Set when the app package is first imported, the earliest point we control
+STARTED_AT = time.perf_counter()
+
+_stages = {}
+_ready_at = None
+
+
+@contextmanager
+def timed_stage(name: str):
+    """Record how long a startup stage takes, in milliseconds"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _stages[name] = round((time.perf_counter() - start) * 1000, 3)
+
+
+def mark_ready():
+    """Record the moment the server is ready to take requests"""
+    global _ready_at
+    _ready_at = time.perf_counter()
+
+
+def startup_report() -> dict:
+    """Stage timings of this process since the app package was imported"""
+    return {
+        "ready_ms": round((_ready_at - STARTED_AT) * 1000, 3) if _ready_at else None,
+        "stages": dict(_stages),
+        "modules_loaded": len(sys.modules)
+    }
@@ -1,8 +1,31 @@
-from .file_handlers import extract_text_from_pdf, extract_text_from_docx
-from .resume_generator import save_resume_docx
-
-__all__ = [
-    "extract_text_from_pdf",
-    "extract_text_from_docx",
-    "save_resume_docx"
-]
+import importlib
+
+# Exported names and the submodule defining each; submodules are imported on
+# first attribute access so light utilities do not pull in PyPDF2 or python-docx
+_EXPORTS = {
+    "extract_document": "file_handlers",
+    "extract_text": "file_handlers",
+    "extract_text_from_pdf": "file_handlers",
+    "extract_text_from_docx": "file_handlers",
+    "save_resume_docx": "resume_generator",
+    "render_resume_docx": "docx_templates",
+    "list_templates": "docx_templates",
+    "score_resume": "ats_scorer",
+    "score_resumes": "ats_scorer",
+    "run_in_worker": "concurrency",
+    "run_in_process": "concurrency",
+    "workflow_slot": "concurrency",
+    "UploadRejected": "uploads",
+    "StoredUpload": "uploads",
+    "store_upload": "uploads"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
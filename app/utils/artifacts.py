@@ -0,0 +1,180 @@
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import shutil
+import time
+import uuid
+from app import config
+from .concurrency import run_in_worker
+
+
+# Artifact names are "<sha256>.<extension>"
+_NAME_RE = re.compile(r"^([0-9a-f]{64})\.([a-z0-9]{1,8})$")
+TMP_DIR = "tmp"
+
+logger = logging.getLogger(__name__)
+
+
+def artifact_name(data: bytes, extension: str) -> str:
+    """Content-addressed name of a document"""
+    return f"{hashlib.sha256(data).hexdigest()}.{extension}"
+
+
+class ArtifactStore:
+    """Content-addressed files sharded as ``root/ab/cd/<sha256>.<ext>``
+
+    Identical content is stored once. ``sweep`` removes files older than
+    ``max_age_seconds`` and then the least recently stored ones until the
+    store fits in ``max_bytes``; storing existing content refreshes it.
+    Scratch files live under ``root/tmp`` and are swept by age only.
+    """
+
+    def __init__(self, root: str, max_bytes: int, max_age_seconds: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.removed = 0
+        self.freed_bytes = 0
+        self._usage = {"files": 0, "bytes": 0}
+
+    def path_for(self, name: str):
+        """Path of an artifact, or None if the name is not content-addressed"""
+        match = _NAME_RE.match(name)
+        if match is None:
+            return None
+        digest = match.group(1)
+        return os.path.join(self.root, digest[:2], digest[2:4], name)
+
+    def find(self, name: str):
+        """Path of a stored artifact, also accepting legacy files in the root"""
+        path = self.path_for(name)
+        if path is None and os.path.basename(name) == name and name not in ("", ".", ".."):
+            path = os.path.join(self.root, name)
+        return path if path and os.path.isfile(path) else None
+
+    def temp_path(self, extension: str) -> str:
+        """Unique scratch path inside the store, for files still being written"""
+        directory = self.temp_dir()
+        return os.path.join(directory, f"{uuid.uuid4().hex}.{extension}")
+
+    def temp_dir(self) -> str:
+        directory = os.path.join(self.root, TMP_DIR)
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def adopt(self, tmp_path: str, sha256: str, extension: str) -> str:
+        """Move a fully written scratch file into place, returning its name"""
+        name = f"{sha256}.{extension}"
+        path = self.path_for(name)
+        if os.path.exists(path):
+            os.remove(tmp_path)
+            os.utime(path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        return name
+
+    def put(self, data: bytes, extension: str) -> str:
+        """Store a document, returning its name"""
+        name = artifact_name(data, extension)
+        path = self.path_for(name)
+        if os.path.exists(path):
+            os.utime(path)
+            return name
+        tmp_path = self.temp_path(extension)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        return self.adopt(tmp_path, name.split(".")[0], extension)
+
+    def _scan(self) -> tuple:
+        """List (mtime, size, path, is_dir) of artifacts and of scratch entries"""
+        artifacts, scratch = [], []
+        if not os.path.isdir(self.root):
+            return artifacts, scratch
+        for entry in os.scandir(self.root):
+            if entry.is_file():
+                artifacts.append(entry)
+            elif entry.name == TMP_DIR:
+                for item in os.scandir(entry.path):
+                    scratch.append(item)
+            elif entry.is_dir() and len(entry.name) == 2:
+                for shard in os.scandir(entry.path):
+                    if shard.is_dir():
+                        artifacts.extend(item for item in os.scandir(shard.path) if item.is_file())
+
+        def describe(entries):
+            described = []
+            for item in entries:
+                try:
+                    stat = item.stat()
+                except FileNotFoundError:
+                    continue
+                is_dir = item.is_dir()
+                described.append((stat.st_mtime, 0 if is_dir else stat.st_size, item.path, is_dir))
+            return described
+
+        return describe(artifacts), describe(scratch)
+
+    def _remove(self, path: str, size: int, is_dir: bool = False):
+        try:
+            if is_dir:
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+        except FileNotFoundError:
+            return
+        self.removed += 1
+        self.freed_bytes += size
+
+    def sweep(self) -> dict:
+        """Enforce the age and size quotas, returning what is left"""
+        artifacts, scratch = self._scan()
+        cutoff = time.time() - self.max_age_seconds
+
+        for mtime, size, path, is_dir in scratch:
+            if mtime < cutoff:
+                self._remove(path, size, is_dir)
+
+        kept = []
+        for mtime, size, path, _ in artifacts:
+            if mtime < cutoff:
+                self._remove(path, size)
+            else:
+                kept.append((mtime, size, path))
+
+        total = sum(size for _, size, _ in kept)
+        kept.sort()
+        while kept and total > self.max_bytes:
+            _, size, path = kept.pop(0)
+            self._remove(path, size)
+            total -= size
+
+        self._usage = {"files": len(kept), "bytes": total}
+        return self.stats()
+
+    def stats(self) -> dict:
+        """Usage as of the last sweep, plus removal counters"""
+        return {
+            "root": self.root,
+            **self._usage,
+            "max_bytes": self.max_bytes,
+            "removed": self.removed,
+            "freed_bytes": self.freed_bytes
+        }
+
+
+upload_store = ArtifactStore(config.UPLOAD_DIR, config.UPLOAD_QUOTA_BYTES, config.UPLOAD_MAX_AGE_SECONDS)
+output_store = ArtifactStore(config.OUTPUT_DIR, config.OUTPUT_QUOTA_BYTES, config.OUTPUT_MAX_AGE_SECONDS)
+
+
+async def run_sweeper(stores: list, interval: int):
+    """Sweep the stores every ``interval`` seconds until cancelled"""
+    while True:
+        for store in stores:
+            try:
+                await run_in_worker(store.sweep)
+            except Exception:
+                logger.exception("Artifact sweep of %s failed", store.root)
+        await asyncio.sleep(interval)
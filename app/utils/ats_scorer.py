@@ -0,0 +1,221 @@
+import re
+from .ats_taxonomy import SKILL_TAXONOMY, KEYWORD_ALIASES, ACTION_VERBS
+
+
+# Tokens keep the punctuation that is part of skill names (c++, c#, node.js, ci/cd)
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./\-][a-z0-9+#]+)*")
+_NUMBER_RE = re.compile(r"\d")
+_END = "\0"
+
+# Weights of the three score components (sum to 100)
+SECTION_WEIGHT = 40
+KEYWORD_WEIGHT = 35
+CONTENT_WEIGHT = 25
+
+# Without a job description, this many distinct keywords counts as full coverage
+TARGET_KEYWORD_COUNT = 15
+MAX_MISSING_KEYWORDS = 10
+
+# Sections an ATS expects, with their share of the section score
+REQUIRED_SECTIONS = {
+    "name": 10,
+    "email": 15,
+    "phone": 10,
+    "summary": 15,
+    "experience": 25,
+    "education": 15,
+    "skills": 10
+}
+
+
+def tokenize(text: str) -> list:
+    """Split text into lowercase tokens"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class KeywordMatcher:
+    """Token trie that finds every taxonomy keyword in one pass over the text"""
+
+    def __init__(self, taxonomy: dict, aliases: dict):
+        self._root = {}
+        self.categories = {}
+        for category, keywords in taxonomy.items():
+            for keyword in keywords:
+                self._add(keyword, keyword)
+                self.categories.setdefault(keyword, []).append(category)
+        for alias, keyword in aliases.items():
+            self._add(alias, keyword)
+        self.max_depth = max(
+            len(tokenize(phrase)) for phrase in list(self.categories) + list(aliases)
+        )
+
+    def _add(self, phrase: str, keyword: str):
+        node = self._root
+        for token in tokenize(phrase):
+            node = node.setdefault(token, {})
+        node[_END] = keyword
+
+    def find(self, text: str) -> dict:
+        """Return {keyword: occurrences} for all keywords found in text"""
+        tokens = tokenize(text)
+        found = {}
+        for start in range(len(tokens)):
+            node = self._root
+            # Walk is bounded by the longest phrase, so the scan stays linear
+            for token in tokens[start:start + self.max_depth]:
+                node = node.get(token)
+                if node is None:
+                    break
+                keyword = node.get(_END)
+                if keyword is not None:
+                    found[keyword] = found.get(keyword, 0) + 1
+        return found
+
+
+_matcher = None
+
+
+def get_matcher() -> KeywordMatcher:
+    """Build the taxonomy matcher once and reuse it"""
+    global _matcher
+    if _matcher is None:
+        _matcher = KeywordMatcher(SKILL_TAXONOMY, KEYWORD_ALIASES)
+    return _matcher
+
+
+def _flatten_text(value) -> str:
+    """Join every string in a nested resume structure"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return "\n".join(_flatten_text(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return "\n".join(_flatten_text(v) for v in value)
+    return ""
+
+
+def _section_score(resume: dict) -> tuple:
+    """Score section completeness and list the missing sections"""
+    score = 0
+    missing = []
+    for section, weight in REQUIRED_SECTIONS.items():
+        if resume.get(section):
+            score += weight
+        else:
+            missing.append(section)
+    return score / 100, missing
+
+
+def _content_score(resume: dict) -> tuple:
+    """Score bullet quality: action verbs, quantified results and detail"""
+    # Descriptions may be a string or a list of bullets
+    descriptions = [
+        _flatten_text(item.get("description", ""))
+        for key in ("experience", "projects")
+        for item in resume.get(key) or []
+        if isinstance(item, dict)
+    ]
+    descriptions = [d for d in descriptions if d]
+    if not descriptions:
+        return 0.0, {"action_verbs": 0.0, "quantified": 0.0, "detailed": 0.0}
+
+    lines = [line.strip(" -•*\t") for d in descriptions for line in d.splitlines()]
+    lines = [line for line in lines if line]
+    first_words = [tokenize(line)[:1] for line in lines]
+    action = sum(1 for words in first_words if words and words[0] in ACTION_VERBS)
+    quantified = sum(1 for d in descriptions if _NUMBER_RE.search(d))
+    detailed = sum(1 for d in descriptions if len(d.split()) >= 15)
+
+    ratios = {
+        "action_verbs": action / len(lines),
+        "quantified": quantified / len(descriptions),
+        "detailed": detailed / len(descriptions)
+    }
+    score = 0.4 * ratios["action_verbs"] + 0.35 * ratios["quantified"] + 0.25 * ratios["detailed"]
+    return score, ratios
+
+
+def _keyword_score(found: dict, job_description: str) -> tuple:
+    """Score keyword coverage and list the keywords worth adding"""
+    matcher = get_matcher()
+
+    if job_description:
+        wanted = matcher.find(job_description)
+        if wanted:
+            missing = sorted(
+                (k for k in wanted if k not in found),
+                key=lambda k: (-wanted[k], k)
+            )
+            coverage = (len(wanted) - len(missing)) / len(wanted)
+            return coverage, missing[:MAX_MISSING_KEYWORDS]
+
+    # No job description: compare against the resume's strongest categories
+    category_hits = {}
+    for keyword in found:
+        for category in matcher.categories.get(keyword, []):
+            category_hits[category] = category_hits.get(category, 0) + 1
+    top_categories = sorted(category_hits, key=lambda c: (-category_hits[c], c))[:2]
+
+    missing = []
+    for category in top_categories:
+        for keyword in SKILL_TAXONOMY[category][:8]:
+            if keyword not in found and keyword not in missing:
+                missing.append(keyword)
+
+    coverage = min(1.0, len(found) / TARGET_KEYWORD_COUNT)
+    return coverage, missing[:MAX_MISSING_KEYWORDS]
+
+
+def score_resume(resume: dict, job_description: str = "") -> dict:
+    """Deterministically score a parsed resume for ATS compatibility"""
+    resume = resume or {}
+    found = get_matcher().find(_flatten_text(resume))
+
+    section_ratio, missing_sections = _section_score(resume)
+    keyword_ratio, missing_keywords = _keyword_score(found, job_description)
+    content_ratio, content = _content_score(resume)
+
+    score = round(
+        SECTION_WEIGHT * section_ratio
+        + KEYWORD_WEIGHT * keyword_ratio
+        + CONTENT_WEIGHT * content_ratio
+    )
+
+    improvements = []
+    for section in missing_sections:
+        improvements.append(f"Add a {section} section")
+    if missing_keywords:
+        target = "the job description" if job_description else "your field"
+        improvements.append(
+            f"Include relevant keywords from {target}, such as: {', '.join(missing_keywords[:5])}"
+        )
+    if content["action_verbs"] < 0.5:
+        improvements.append("Start experience and project bullets with strong action verbs")
+    if content["quantified"] < 0.5:
+        improvements.append("Quantify achievements with numbers, percentages or scale")
+    if content["detailed"] < 0.5:
+        improvements.append("Expand short experience and project descriptions with concrete outcomes")
+
+    if score >= 80:
+        verdict = "Strong ATS compatibility."
+    elif score >= 60:
+        verdict = "Good ATS compatibility with room for improvement."
+    else:
+        verdict = "Low ATS compatibility."
+    feedback = (
+        f"{verdict} Sections complete: {round(section_ratio * 100)}%, "
+        f"keyword coverage: {round(keyword_ratio * 100)}% ({len(found)} keywords found), "
+        f"content quality: {round(content_ratio * 100)}%."
+    )
+
+    return {
+        "score": score,
+        "feedback": feedback,
+        "improvements": improvements,
+        "missing_keywords": missing_keywords
+    }
+
+
+def score_resumes(resumes, job_description: str = "") -> list:
+    """Score many parsed resumes against the same job description"""
+    return [score_resume(resume, job_description) for resume in resumes]
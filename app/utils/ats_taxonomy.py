@@ -0,0 +1,109 @@
+# Skill/keyword taxonomy used by the local ATS scorer.
+# Keywords within a category are ordered by how often recruiters search for them,
+# so the first entries are suggested first when a keyword is missing.
+
+SKILL_TAXONOMY = {
+    "programming_languages": [
+        "python", "java", "javascript", "typescript", "sql", "c++", "c#", "golang",
+        "rust", "kotlin", "swift", "ruby", "php", "scala", "bash"
+    ],
+    "web_development": [
+        "react", "node.js", "html", "css", "rest api", "angular", "vue",
+        "next.js", "django", "flask", "fastapi", "spring boot", "express",
+        "graphql", "tailwind", "redux"
+    ],
+    "cloud_devops": [
+        "aws", "docker", "kubernetes", "ci/cd", "terraform", "azure",
+        "google cloud", "linux", "jenkins", "github actions", "ansible",
+        "microservices", "serverless", "monitoring", "prometheus", "helm"
+    ],
+    "data_engineering": [
+        "sql", "etl", "spark", "airflow", "kafka", "data pipeline",
+        "data warehouse", "snowflake", "bigquery", "dbt", "hadoop",
+        "postgresql", "mongodb", "redis", "databricks", "data modeling"
+    ],
+    "data_science_ml": [
+        "machine learning", "python", "pandas", "numpy", "scikit-learn",
+        "deep learning", "tensorflow", "pytorch", "statistics", "nlp",
+        "computer vision", "data analysis", "data visualization", "llm",
+        "langchain", "a/b testing"
+    ],
+    "mobile": [
+        "android", "ios", "react native", "flutter", "kotlin", "swift",
+        "mobile development", "firebase", "xcode", "jetpack compose"
+    ],
+    "testing_quality": [
+        "unit testing", "test automation", "selenium", "pytest", "jest",
+        "integration testing", "tdd", "qa", "cypress", "performance testing"
+    ],
+    "project_management": [
+        "agile", "scrum", "stakeholder management", "project management",
+        "jira", "kanban", "roadmap", "budgeting", "risk management",
+        "cross-functional", "pmp", "prince2"
+    ],
+    "design": [
+        "figma", "ui/ux", "user research", "wireframing", "prototyping",
+        "adobe photoshop", "adobe illustrator", "design systems",
+        "usability testing", "sketch"
+    ],
+    "business_analytics": [
+        "excel", "power bi", "tableau", "data analysis", "reporting",
+        "kpi", "forecasting", "business intelligence", "requirements gathering",
+        "process improvement", "financial modeling", "crm", "salesforce"
+    ],
+    "soft_skills": [
+        "leadership", "communication", "teamwork", "problem solving",
+        "mentoring", "collaboration", "time management", "critical thinking",
+        "presentation", "negotiation"
+    ]
+}
+
+# Alternate spellings mapped to the canonical keyword
+KEYWORD_ALIASES = {
+    "js": "javascript",
+    "ts": "typescript",
+    "go lang": "golang",
+    "nodejs": "node.js",
+    "node": "node.js",
+    "reactjs": "react",
+    "react.js": "react",
+    "vue.js": "vue",
+    "nextjs": "next.js",
+    "k8s": "kubernetes",
+    "amazon web services": "aws",
+    "gcp": "google cloud",
+    "google cloud platform": "google cloud",
+    "ci cd": "ci/cd",
+    "cicd": "ci/cd",
+    "continuous integration": "ci/cd",
+    "postgres": "postgresql",
+    "ml": "machine learning",
+    "ai": "machine learning",
+    "sklearn": "scikit-learn",
+    "natural language processing": "nlp",
+    "restful api": "rest api",
+    "restful apis": "rest api",
+    "rest apis": "rest api",
+    "ux": "ui/ux",
+    "ui": "ui/ux",
+    "user experience": "ui/ux",
+    "ms excel": "excel",
+    "microsoft excel": "excel",
+    "powerbi": "power bi",
+    "test driven development": "tdd",
+    "large language models": "llm",
+    "llms": "llm",
+    "team leadership": "leadership",
+    "mentored": "mentoring",
+    "led": "leadership"
+}
+
+# Strong verbs that recruiters and ATS parsers look for at the start of bullets
+ACTION_VERBS = {
+    "achieved", "architected", "automated", "built", "collaborated", "created",
+    "decreased", "delivered", "designed", "developed", "drove", "enhanced",
+    "established", "implemented", "improved", "increased", "launched", "led",
+    "managed", "mentored", "migrated", "optimized", "orchestrated", "owned",
+    "reduced", "refactored", "resolved", "scaled", "shipped", "spearheaded",
+    "streamlined", "trained"
+}
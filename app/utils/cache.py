@@ -0,0 +1,201 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+import aiosqlite
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """In-process LRU in front of a persistent SQLite store
+
+    The store is best effort: if the database cannot be opened, read or
+    written, the error is logged and the lookup counts as a miss.
+    Access times of disk hits are written along with the next ``set``
+    rather than on the read path.
+    """
+
+    # Run disk eviction once every N writes instead of on every write
+    EVICT_EVERY = 64
+
+    def __init__(self, path: str, namespace: str, memory_entries: int = 256,
+                 max_entries: int = 10000, ttl_seconds: float = 7 * 24 * 3600):
+        self.path = path
+        self.namespace = namespace
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory = OrderedDict()
+        self._db = None
+        self._db_lock = None
+        self._writes = 0
+        self._touched = {}
+        self.hits = 0
+        self.memory_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+    async def _connection(self) -> aiosqlite.Connection:
+        """Open the SQLite store on first use"""
+        if self._db is not None:
+            return self._db
+        if self._db_lock is None:
+            self._db_lock = asyncio.Lock()
+        async with self._db_lock:
+            if self._db is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                db = await aiosqlite.connect(self.path)
+                try:
+                    await db.execute("PRAGMA journal_mode=WAL")
+                    await db.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS cache (
+                            namespace TEXT NOT NULL,
+                            key TEXT NOT NULL,
+                            value TEXT NOT NULL,
+                            created_at REAL NOT NULL,
+                            accessed_at REAL NOT NULL,
+                            PRIMARY KEY (namespace, key)
+                        )
+                        """
+                    )
+                    await db.execute(
+                        "CREATE INDEX IF NOT EXISTS cache_accessed ON cache (namespace, accessed_at)"
+                    )
+                    await db.commit()
+                except BaseException:
+                    # A half-initialized connection would keep its thread alive
+                    await db.close()
+                    raise
+                self._db = db
+        return self._db
+
+    def _store_failed(self, action: str, error: Exception):
+        self.errors += 1
+        logger.warning("%s cache %s failed, continuing without it: %s", self.namespace, action, error)
+
+    async def _flush_touched(self, db: aiosqlite.Connection):
+        """Write the access times of disk hits since the last write (not committed)"""
+        if self._touched:
+            touched, self._touched = self._touched, {}
+            await db.executemany(
+                "UPDATE cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                [(accessed_at, self.namespace, key) for key, accessed_at in touched.items()]
+            )
+
+    def _remember(self, key: str, payload: str, created_at: float):
+        """Store a serialized value in the in-process LRU"""
+        self._memory[key] = (payload, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    async def get(self, key: str):
+        """Return the cached value for key, or None on a miss"""
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            payload, created_at = entry
+            if now - created_at <= self.ttl_seconds:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return json.loads(payload)
+            del self._memory[key]
+
+        try:
+            db = await self._connection()
+            async with db.execute(
+                "SELECT value, created_at FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ) as cursor:
+                row = await cursor.fetchone()
+        except (aiosqlite.Error, OSError) as e:
+            self._store_failed("read", e)
+            row = None
+
+        if row is None or now - row[1] > self.ttl_seconds:
+            self.misses += 1
+            return None
+
+        self._touched[key] = now
+        self._remember(key, row[0], row[1])
+        self.hits += 1
+        return json.loads(row[0])
+
+    async def set(self, key: str, value):
+        """Store a JSON-serializable value under key"""
+        now = time.time()
+        payload = json.dumps(value)
+        self._remember(key, payload, now)
+
+        try:
+            db = await self._connection()
+            await self._flush_touched(db)
+            await db.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, payload, now, now)
+            )
+            await db.commit()
+
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                await self.evict()
+        except (aiosqlite.Error, OSError) as e:
+            self._store_failed("write", e)
+            if self._db is not None:
+                try:
+                    await self._db.rollback()
+                except (aiosqlite.Error, OSError):
+                    pass
+
+    async def evict(self):
+        """Drop expired entries and trim the store to max_entries"""
+        db = await self._connection()
+        expired = await db.execute(
+            "DELETE FROM cache WHERE namespace = ? AND created_at < ?",
+            (self.namespace, time.time() - self.ttl_seconds)
+        )
+        trimmed = await db.execute(
+            """
+            DELETE FROM cache WHERE namespace = ? AND key IN (
+                SELECT key FROM cache WHERE namespace = ?
+                ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.namespace, self.namespace, self.max_entries)
+        )
+        await db.commit()
+        self.evictions += max(expired.rowcount, 0) + max(trimmed.rowcount, 0)
+
+    async def close(self):
+        """Close the SQLite connection"""
+        if self._db is not None:
+            try:
+                await self._flush_touched(self._db)
+                await self._db.commit()
+            except (aiosqlite.Error, OSError) as e:
+                self._store_failed("write", e)
+            await self._db.close()
+            self._db = None
+
+    def stats(self) -> dict:
+        """Return hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "memory_entries": len(self._memory)
+        }
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from functools import partial
+from app import config
+from .metrics import workflows_in_flight
+
+
+_worker_pool = ThreadPoolExecutor(
+    max_workers=config.WORKER_POOL_SIZE,
+    thread_name_prefix="resume-worker"
+)
+_process_pool = None
+_process_pool_lock = threading.Lock()
+_workflow_slots = None
+
+
+async def run_in_worker(func, *args, **kwargs):
+    """Run a blocking function on the bounded worker pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_worker_pool, partial(func, *args, **kwargs))
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=config.PROCESS_POOL_SIZE)
+        return _process_pool
+
+
+def reset_process_pool(pool: ProcessPoolExecutor):
+    """Kill a pool running a task past its deadline; the next caller gets a fresh pool
+
+    Executors cannot cancel a running task, so the pool's processes are
+    terminated. Other tasks still running on it fail with BrokenProcessPool.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    # ProcessPoolExecutor has no public way to reach its processes
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_process(func, *args, timeout: float = None):
+    """Run a CPU-bound, picklable function on the process pool
+
+    With ``timeout`` an overrunning call resets the pool instead of keeping
+    a process busy. A call whose pool was reset by another task is retried
+    once on the fresh pool.
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = get_process_pool()
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(pool, func, *args), timeout)
+        except asyncio.TimeoutError:
+            reset_process_pool(pool)
+            raise TimeoutError(f"Processing exceeded its time limit of {timeout}s")
+        except BrokenProcessPool:
+            if attempt:
+                raise
+
+
+@asynccontextmanager
+async def workflow_slot():
+    """Limit the number of workflows running at the same time"""
+    global _workflow_slots
+    if _workflow_slots is None:
+        _workflow_slots = asyncio.Semaphore(config.MAX_INFLIGHT_WORKFLOWS)
+    async with _workflow_slots:
+        workflows_in_flight.inc()
+        try:
+            yield
+        finally:
+            workflows_in_flight.dec()
@@ -0,0 +1,294 @@
+import glob
+import hashlib
+import io
+import os
+import re
+import zipfile
+from xml.sax.saxutils import escape
+from app import config
+
+
+# Bump whenever the generated XML changes so cached renders are not reused
+RENDERER_VERSION = "1"
+
+DOCUMENT_PART = "word/document.xml"
+
+# Characters XML 1.0 does not allow, which LLM output occasionally contains
+_INVALID_XML_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_BULLET_RE = re.compile(r"^[\-*\u2022\u25aa\u25cf]+\s*")
+
+# Look of the built-in templates; ``layout`` selects how entries are laid out
+BUILTIN_TEMPLATES = {
+    "modern": {
+        "font": "Calibri", "size": 10.5, "accent": "2E74B5",
+        "title_size": 26, "heading_size": 12, "subheading_size": 11,
+        "margin_inches": 0.8, "heading_rule": True, "layout": "modern"
+    },
+    "classic": {
+        "font": "Times New Roman", "size": 11, "accent": "000000",
+        "title_size": 22, "heading_size": 13, "subheading_size": 11.5,
+        "margin_inches": 1.0, "heading_rule": False, "layout": "classic"
+    },
+    "compact": {
+        "font": "Arial", "size": 9.5, "accent": "404040",
+        "title_size": 18, "heading_size": 10.5, "subheading_size": 10,
+        "margin_inches": 0.5, "heading_rule": True, "layout": "compact"
+    }
+}
+
+# Paragraph snippets every layout is assembled from; {ppr} and {rpr} are
+# filled per template, the text placeholder per render
+_PARAGRAPH = '<w:p><w:pPr><w:pStyle w:val="{style}"/>{ppr}</w:pPr>{runs}</w:p>'
+_RUN = '<w:r>{rpr}<w:t xml:space="preserve">{{{field}}}</w:t></w:r>'
+_CENTER = '<w:jc w:val="center"/>'
+_KEEP_NEXT = '<w:keepNext/>'
+_TIGHT = '<w:spacing w:before="0" w:after="0"/>'
+_BOLD = '<w:rPr><w:b/></w:rPr>'
+_ITALIC = '<w:rPr><w:i/><w:color w:val="595959"/></w:rPr>'
+
+
+def _paragraph(style: str, *runs, ppr: str = "") -> str:
+    """Precompile a paragraph with one placeholder run per (field, rpr) pair"""
+    return _PARAGRAPH.format(
+        style=style,
+        ppr=ppr,
+        runs="".join(_RUN.format(rpr=rpr, field=field) for field, rpr in runs)
+    )
+
+
+class DocxTemplate:
+    """A DOCX package split into static parts and precompiled body snippets
+
+    Loading keeps every part except ``word/document.xml`` as an already
+    compressed zip, plus the document XML before and after the body content.
+    Rendering clones that zip in memory and appends one generated
+    ``document.xml``, so python-docx never runs per resume.
+    """
+
+    def __init__(self, name: str, package: bytes, layout: str = "modern"):
+        self.name = name
+        self.layout = layout
+        # Changes whenever the template file does, so cached renders are not reused
+        self.fingerprint = hashlib.sha256(package).hexdigest()[:16]
+        with zipfile.ZipFile(io.BytesIO(package)) as source:
+            document = source.read(DOCUMENT_PART).decode("utf-8")
+            prefix = io.BytesIO()
+            with zipfile.ZipFile(prefix, "w", zipfile.ZIP_DEFLATED) as target:
+                for item in source.infolist():
+                    if item.filename != DOCUMENT_PART:
+                        target.writestr(item, source.read(item.filename))
+        self._prefix = prefix.getvalue()
+
+        # Body content is replaced; the final section properties are kept
+        body_start = document.index("<w:body>") + len("<w:body>")
+        sect_start = document.rfind("<w:sectPr")
+        body_end = document.rindex("</w:body>")
+        self._head = document[:body_start]
+        self._tail = document[sect_start:] if sect_start >= body_start else document[body_end:]
+        self._snippets = self._compile_snippets()
+
+    def _compile_snippets(self) -> dict:
+        """Precompile the paragraphs each layout is made of"""
+        compact = self.layout == "compact"
+        return {
+            "name": _paragraph("Title", ("name", ""), ppr=_CENTER),
+            "contact": _paragraph("Normal", ("text", ""), ppr=_CENTER + (_TIGHT if compact else "")),
+            "heading": _paragraph("Heading1", ("text", "")),
+            "entry": _paragraph("Heading2", ("title", ""), ("detail", "")),
+            "entry_inline": _paragraph(
+                "Normal", ("title", _BOLD), ("detail", ""), ppr=_KEEP_NEXT + _TIGHT
+            ),
+            "meta": _paragraph("Normal", ("text", _ITALIC), ppr=_KEEP_NEXT + _TIGHT),
+            "text": _paragraph("Normal", ("text", ""), ppr=_TIGHT if compact else ""),
+            "bullet": _paragraph("ListBullet", ("text", ""), ppr=_TIGHT if compact else "")
+        }
+
+    def _body(self, data: dict) -> list:
+        """Assemble the body paragraphs for a resume"""
+        s = self._snippets
+        layout = self.layout
+        parts = [s["name"].format(name=_text(data.get("name")) or "Resume")]
+
+        contact = [_text(data.get(key)) for key in ("email", "phone", "linkedin")]
+        separator = " | " if layout == "classic" else " · "
+        parts.append(s["contact"].format(text=separator.join(c for c in contact if c)))
+
+        def heading(title):
+            parts.append(s["heading"].format(text=title.upper() if layout != "classic" else title.title()))
+
+        def entry(title, detail):
+            key = "entry_inline" if layout == "compact" else "entry"
+            parts.append(s[key].format(title=title, detail=detail))
+
+        def description(value):
+            lines = [_BULLET_RE.sub("", line).strip() for line in _text(value).split("\n")]
+            lines = [line for line in lines if line]
+            if layout == "classic" or len(lines) == 1 and layout != "compact":
+                parts.extend(s["text"].format(text=line) for line in lines)
+            else:
+                parts.extend(s["bullet"].format(text=line) for line in lines)
+
+        if data.get("summary"):
+            heading("Professional Summary")
+            parts.append(s["text"].format(text=_text(data["summary"])))
+
+        if data.get("experience"):
+            heading("Experience")
+            for exp in _entries(data["experience"]):
+                title, company, duration = (_text(exp.get(k)) for k in ("title", "company", "duration"))
+                if layout == "compact":
+                    detail = ", ".join(v for v in (company, duration) if v)
+                    entry(title, f" — {detail}" if detail else "")
+                else:
+                    if company:
+                        entry(title, f" at {company}" if layout == "classic" else f" | {company}")
+                    else:
+                        entry(title, "")
+                    if duration:
+                        parts.append(s["meta"].format(text=duration))
+                description(exp.get("description"))
+
+        if data.get("education"):
+            heading("Education")
+            for edu in _entries(data["education"]):
+                degree, field, institution, year = (
+                    _text(edu.get(k)) for k in ("degree", "field", "institution", "year")
+                )
+                entry(degree, f" in {field}" if field else "")
+                meta = ", ".join(v for v in (institution, year) if v)
+                if meta:
+                    parts.append(s["meta"].format(text=meta))
+
+        if data.get("skills"):
+            heading("Skills")
+            skills = data["skills"] if isinstance(data["skills"], list) else [data["skills"]]
+            joiner = ", " if layout == "classic" else " · "
+            parts.append(s["text"].format(text=joiner.join(_text(skill) for skill in skills)))
+
+        if data.get("projects"):
+            heading("Projects")
+            for project in _entries(data["projects"]):
+                entry(_text(project.get("title")), "")
+                description(project.get("description"))
+
+        return parts
+
+    def render(self, data: dict) -> bytes:
+        """Render a resume dict into DOCX bytes"""
+        document = self._head + "".join(self._body(data or {})) + self._tail
+        buffer = io.BytesIO(self._prefix)
+        buffer.seek(0, io.SEEK_END)
+        with zipfile.ZipFile(buffer, "a", zipfile.ZIP_DEFLATED, compresslevel=1) as package:
+            package.writestr(DOCUMENT_PART, document)
+        return buffer.getvalue()
+
+
+def _text(value) -> str:
+    """Escape any resume value for use as XML text"""
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        value = "\n".join(_text(v) for v in value)
+    return escape(_INVALID_XML_RE.sub("", str(value)))
+
+
+def _entries(value) -> list:
+    """Experience/education/project lists, skipping malformed items"""
+    return [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
+
+
+def _builtin_package(options: dict) -> bytes:
+    """Build a built-in template's styles with python-docx, once"""
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import nsdecls
+    from docx.shared import Inches, Pt, RGBColor
+
+    doc = Document()
+    accent = RGBColor.from_string(options["accent"])
+
+    for section in doc.sections:
+        section.top_margin = section.bottom_margin = Inches(options["margin_inches"])
+        section.left_margin = section.right_margin = Inches(options["margin_inches"])
+
+    normal = doc.styles["Normal"]
+    normal.font.name = options["font"]
+    normal.font.size = Pt(options["size"])
+    normal.paragraph_format.space_after = Pt(2)
+
+    title = doc.styles["Title"]
+    title.font.name = options["font"]
+    title.font.size = Pt(options["title_size"])
+    title.font.bold = True
+    title.font.color.rgb = accent
+    title.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    title.paragraph_format.space_after = Pt(2)
+    # The default Title style draws a rule under the name; drop it
+    for border in title.element.xpath("./w:pPr/w:pBdr"):
+        border.getparent().remove(border)
+
+    for style_name, size_key in (("Heading 1", "heading_size"), ("Heading 2", "subheading_size")):
+        style = doc.styles[style_name]
+        style.font.name = options["font"]
+        style.font.size = Pt(options[size_key])
+        style.font.bold = True
+        style.font.color.rgb = accent if style_name == "Heading 1" else RGBColor(0, 0, 0)
+        style.paragraph_format.space_before = Pt(8 if style_name == "Heading 1" else 4)
+        style.paragraph_format.space_after = Pt(2)
+
+    if options["heading_rule"]:
+        rule = parse_xml(
+            f'<w:pBdr {nsdecls("w")}><w:bottom w:val="single" w:sz="6" w:space="1" '
+            f'w:color="{options["accent"]}"/></w:pBdr>'
+        )
+        doc.styles["Heading 1"].element.get_or_add_pPr().append(rule)
+
+    bullet = doc.styles["List Bullet"]
+    bullet.font.name = options["font"]
+    bullet.font.size = Pt(options["size"])
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+_templates = {}
+
+
+def load_templates() -> dict:
+    """Load the built-in templates and any ``*.docx`` in TEMPLATE_DIR, once
+
+    A custom template keeps its styles, page setup, headers and footers;
+    its body is replaced by the resume using the "modern" layout.
+    """
+    if not _templates:
+        loaded = {
+            name: DocxTemplate(name, _builtin_package(options), options["layout"])
+            for name, options in BUILTIN_TEMPLATES.items()
+        }
+        for path in sorted(glob.glob(os.path.join(config.TEMPLATE_DIR, "*.docx"))):
+            name = os.path.splitext(os.path.basename(path))[0].lower()
+            with open(path, "rb") as f:
+                loaded[name] = DocxTemplate(name, f.read())
+        _templates.update(loaded)
+    return _templates
+
+
+def list_templates() -> list:
+    """Names of the available templates"""
+    return sorted(load_templates())
+
+
+def get_template(name: str) -> DocxTemplate:
+    """Return a loaded template by name"""
+    templates = load_templates()
+    template = templates.get((name or config.DEFAULT_TEMPLATE).lower())
+    if template is None:
+        raise Exception(f"Unknown template '{name}', expected one of: {', '.join(sorted(templates))}")
+    return template
+
+
+def render_resume_docx(data: dict, template: str = None) -> bytes:
+    """Render a resume dict with a named template into DOCX bytes"""
+    return get_template(template).render(data)
@@ -0,0 +1,55 @@
+import os
+from app import config
+from .cache import ResultCache
+from .concurrency import run_in_worker
+from .metrics import extraction_duration, page_bucket
+from .profiling import span
+
+
+extraction_cache = ResultCache(
+    config.CACHE_DB_PATH,
+    namespace="extraction",
+    memory_entries=config.EXTRACTION_CACHE_MEMORY_ENTRIES,
+    max_entries=config.EXTRACTION_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.EXTRACTION_CACHE_TTL_SECONDS
+)
+
+
+def _observe(result: dict) -> dict:
+    """Record how long an extraction took, by file type and page count"""
+    pages = result.get("page_count")
+    extraction_duration.observe(
+        result.get("elapsed_ms", 0) / 1000,
+        file_type=result.get("file_type") or "unknown",
+        pages=page_bucket(pages) if pages else "na"
+    )
+    return result
+
+
+def extraction_key(sha256: str, file_type: str) -> str:
+    """Key an extraction by file fingerprint, extractor version and page limit"""
+    from .file_handlers import EXTRACTOR_VERSION
+    return f"{sha256}:{file_type}:v{EXTRACTOR_VERSION}:p{config.PDF_MAX_PAGES}"
+
+
+async def extract_cached(source, file_type: str, sha256: str, run=run_in_worker) -> dict:
+    """Return the cached extraction for a file, extracting it with ``run`` on a miss"""
+    # PyPDF2 and python-docx load on the first extraction, not at import
+    from .file_handlers import extract_document
+    
+    if file_type is None and isinstance(source, str):
+        file_type = os.path.splitext(source)[1].lstrip(".").lower()
+    
+    if not config.EXTRACTION_CACHE_ENABLED or not sha256:
+        with span("extraction", file_type):
+            return _observe(await run(extract_document, source, file_type))
+    
+    key = extraction_key(sha256, file_type)
+    result = await extraction_cache.get(key)
+    if result is not None:
+        return result
+    
+    with span("extraction", file_type):
+        result = _observe(await run(extract_document, source, file_type))
+    await extraction_cache.set(key, result)
+    return result
@@ -1,25 +1,175 @@
+import io
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError, wait
+from concurrent.futures.process import BrokenProcessPool
 import PyPDF2
 from docx import Document
+from app import config
+from .concurrency import get_process_pool, reset_process_pool
 
 
-def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from PDF file"""
-    text = ""
+# Pages are joined with a form feed so later stages can still see page boundaries
+PAGE_SEPARATOR = "\f"
+
+# Bump whenever extraction output changes so cached extractions are not reused
+EXTRACTOR_VERSION = "2"
+
+
+def _open_source(source):
+    """Return a readable binary stream for a path, bytes-like or file-like source"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if hasattr(source, "read"):
+        if hasattr(source, "seek"):
+            source.seek(0)
+        return source
+    return open(source, "rb")
+
+
+def _read_bytes(source) -> bytes:
+    """Read a whole path, bytes-like or file-like source into bytes"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    stream = _open_source(source)
+    try:
+        return stream.read()
+    finally:
+        if stream is not source:
+            stream.close()
+
+
+def _check_deadline(deadline: float):
+    if deadline is not None and time.time() > deadline:
+        raise TimeoutError("PDF extraction exceeded its time limit")
+
+
+def iter_pdf_pages(source, start: int = 0, stop: int = None, deadline: float = None):
+    """Lazily yield the text of PDF pages in [start, stop), checking the deadline between pages"""
+    stream = _open_source(source)
     try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text()
+        pages = PyPDF2.PdfReader(stream).pages
+        stop = len(pages) if stop is None else min(stop, len(pages))
+        for index in range(start, stop):
+            _check_deadline(deadline)
+            yield pages[index].extract_text() or ""
+    finally:
+        if stream is not source:
+            stream.close()
+
+
+def _extract_pdf_page_range(data: bytes, start: int, stop: int, deadline: float) -> list:
+    """Process pool task: extract the text of one range of pages"""
+    return list(iter_pdf_pages(data, start, stop, deadline))
+
+
+def _extract_pdf_in_pool(data: bytes, page_count: int, deadline: float, parts: int = 1) -> list:
+    """Extract the pages on the process pool in ``parts`` ranges, giving up at the deadline
+
+    A page still running at the deadline gets the pool reset, so it cannot
+    keep a process busy. Extraction whose pool was reset by another
+    document is retried once while time remains.
+    """
+    chunk = max(math.ceil(page_count / parts), 1)
+    for attempt in range(2):
+        pool = get_process_pool()
+        futures = [
+            pool.submit(_extract_pdf_page_range, data, start, min(start + chunk, page_count), deadline)
+            for start in range(0, page_count, chunk)
+        ]
+        done, pending = wait(futures, timeout=max(deadline - time.time(), 0))
+        if pending:
+            reset_process_pool(pool)
+            raise TimeoutError("PDF extraction exceeded its time limit")
+        try:
+            pages = []
+            for future in futures:
+                pages.extend(future.result())
+            return pages
+        except BrokenProcessPool:
+            if attempt or time.time() >= deadline:
+                raise
+
+
+def extract_pdf_pages(source, max_pages: int = None, timeout: float = None) -> list:
+    """Extract the text of each PDF page
+
+    Only the first ``max_pages`` pages are read and extraction fails once
+    ``timeout`` seconds have passed. Pages are extracted on the process
+    pool so a page that never finishes is killed at the deadline instead
+    of holding a thread or a process; large documents are split across
+    several processes.
+    """
+    max_pages = max_pages or config.PDF_MAX_PAGES
+    deadline = time.time() + (timeout or config.PDF_TIMEOUT_SECONDS)
+    try:
+        data = _read_bytes(source)
+        page_count = min(len(PyPDF2.PdfReader(io.BytesIO(data)).pages), max_pages)
+        
+        # Workers of the pool itself (batch extraction) already run in a process
+        if multiprocessing.parent_process() is not None:
+            return list(iter_pdf_pages(data, 0, page_count, deadline))
+        
+        parallel = page_count >= config.PDF_PARALLEL_MIN_PAGES and config.PROCESS_POOL_SIZE > 1
+        return _extract_pdf_in_pool(data, page_count, deadline, config.PROCESS_POOL_SIZE if parallel else 1)
+    except (TimeoutError, FutureTimeoutError) as e:
+        raise Exception(f"Error extracting PDF: {str(e) or 'timed out'}")
     except Exception as e:
         raise Exception(f"Error extracting PDF: {str(e)}")
-    return text
 
 
-def extract_text_from_docx(file_path: str) -> str:
-    """Extract text from DOCX file"""
+def extract_text_from_pdf(source, max_pages: int = None, timeout: float = None) -> str:
+    """Extract text from PDF given a path, bytes, memoryview or file-like object"""
+    return PAGE_SEPARATOR.join(extract_pdf_pages(source, max_pages, timeout))
+
+
+def extract_text_from_docx(source) -> str:
+    """Extract text from DOCX given a path, bytes, memoryview or file-like object"""
     try:
-        doc = Document(file_path)
+        if isinstance(source, (str, os.PathLike)):
+            doc = Document(source)
+        else:
+            doc = Document(_open_source(source))
         text = "\n".join([para.text for para in doc.paragraphs])
     except Exception as e:
         raise Exception(f"Error extracting DOCX: {str(e)}")
     return text
+
+
+def extract_text(source, file_type: str = None) -> str:
+    """Extract text from a PDF or DOCX source
+
+    ``file_type`` ("pdf" or "docx") is required for in-memory sources and
+    defaults to the extension of a path.
+    """
+    if file_type is None and isinstance(source, (str, os.PathLike)):
+        file_type = os.path.splitext(os.fspath(source))[1].lstrip(".").lower()
+    if file_type == "pdf":
+        return extract_text_from_pdf(source)
+    if file_type == "docx":
+        return extract_text_from_docx(source)
+    raise Exception("Unsupported file format")
+
+
+def extract_document(source, file_type: str = None) -> dict:
+    """Extract text along with page count and extraction time"""
+    if file_type is None and isinstance(source, (str, os.PathLike)):
+        file_type = os.path.splitext(os.fspath(source))[1].lstrip(".").lower()
+    
+    started = time.perf_counter()
+    if file_type == "pdf":
+        pages = extract_pdf_pages(source)
+        text = PAGE_SEPARATOR.join(pages)
+        page_count = len(pages)
+    else:
+        text = extract_text(source, file_type)
+        page_count = None
+    
+    return {
+        "text": text,
+        "file_type": file_type,
+        "page_count": page_count,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+    }
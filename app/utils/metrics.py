@@ -0,0 +1,210 @@
+import math
+import threading
+import time
+from functools import wraps
+
+
+# Upper bounds in seconds; LLM calls and whole workflows need the long tail
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def header(self) -> list:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonic counter"""
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> list:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(Counter):
+    """Value that can go up and down"""
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed buckets"""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(buckets) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def render(self) -> list:
+        with self._lock:
+            items = sorted((key, (list(e[0]), e[1], e[2])) for key, e in self._values.items())
+        lines = self.header()
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Registry:
+    """Minimal Prometheus registry: metrics plus callbacks sampled at scrape time"""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: tuple = ()) -> Counter:
+        return self.register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: tuple = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, labels: tuple = (),
+                  buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labels, buckets))
+
+    def collector(self, func):
+        """Register ``func() -> [Metric]``, called on every scrape for derived values"""
+        self._collectors.append(func)
+        return func
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collect in self._collectors:
+            for metric in collect():
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_request_duration = registry.histogram(
+    "resume_http_request_duration_seconds",
+    "Time until the response starts, by route",
+    ("method", "route", "status")
+)
+http_requests_in_flight = registry.gauge(
+    "resume_http_requests_in_flight", "Requests currently being handled"
+)
+http_errors = registry.counter(
+    "resume_http_errors_total", "Responses with a 4xx/5xx status or an unhandled exception",
+    ("method", "route", "status")
+)
+node_duration = registry.histogram(
+    "resume_workflow_node_duration_seconds", "Workflow node run time", ("node",)
+)
+node_errors = registry.counter(
+    "resume_workflow_node_errors_total", "Workflow nodes that raised", ("node", "error")
+)
+workflows_in_flight = registry.gauge(
+    "resume_workflows_in_flight", "Workflows holding a concurrency slot"
+)
+llm_request_duration = registry.histogram(
+    "resume_llm_request_duration_seconds", "Provider round trip per LLM attempt", ("node",)
+)
+llm_tokens = registry.counter(
+    "resume_llm_tokens_total", "Tokens reported by the provider", ("node", "kind")
+)
+llm_errors = registry.counter(
+    "resume_llm_errors_total", "Failed LLM attempts, including retried ones", ("node", "error")
+)
+extraction_duration = registry.histogram(
+    "resume_extraction_duration_seconds", "Text extraction time", ("file_type", "pages")
+)
+
+
+def page_bucket(pages: int) -> str:
+    """Coarse page-count label so extraction metrics keep a small cardinality"""
+    lower = 1
+    for upper in (1, 2, 5, 10, 25, 50):
+        if pages <= upper:
+            return str(upper) if lower == upper else f"{lower}-{upper}"
+        lower = upper + 1
+    return "51+"
+
+
+def timed_node(name: str, func):
+    """Wrap an async workflow node to record its duration and failures"""
+    @wraps(func)
+    async def wrapper(state):
+        started = time.perf_counter()
+        try:
+            return await func(state)
+        except Exception as e:
+            node_errors.inc(node=name, error=type(e).__name__)
+            raise
+        finally:
+            node_duration.observe(time.perf_counter() - started, node=name)
+    return wrapper
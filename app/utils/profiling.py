@@ -0,0 +1,233 @@
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+import uuid
+from contextlib import nullcontext
+from contextvars import ContextVar
+from app import config
+from .concurrency import run_in_worker
+
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+_TRUTHY = {"1", "true", "yes", "on"}
+
+# Rows kept in the summary; the full profile is in cpu.prof
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+
+logger = logging.getLogger(__name__)
+
+_active = ContextVar("request_profile", default=None)
+_NOT_PROFILED = nullcontext()
+
+# cProfile and tracemalloc are process-wide, so overlapping profiles share them
+_cpu_busy = False
+_tracing = 0
+
+
+class _Span:
+    def __init__(self, profile, category: str, name: str):
+        self.profile = profile
+        self.category = category
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profile.record(self.category, self.name, self.started, time.perf_counter(), error=exc[0] is not None)
+        return False
+
+
+def span(category: str, name: str = ""):
+    """Time a step of the profiled request running in this context, if any"""
+    profile = _active.get()
+    return _NOT_PROFILED if profile is None else _Span(profile, category, name)
+
+
+class RequestProfile:
+    """CPU profile, allocation snapshots and a step breakdown of one request
+
+    Used as an async context manager around the request's work; snapshots,
+    analysis and writing run on the worker pool. cProfile only sees
+    the event loop thread (and so also any other request it serves in the
+    meantime); work sent to the worker pools shows up in the breakdown as
+    wall time only. Results go to ``<directory>/<id>/``: ``cpu.prof`` for
+    pstats/snakeviz and ``summary.json`` with the breakdown, the hottest
+    functions and the largest allocation growth.
+    """
+
+    def __init__(self, label: str, directory: str):
+        self.id = f"{time.strftime('%Y%m%d-%H%M%S')}-{label}-{uuid.uuid4().hex[:8]}"
+        self.label = label
+        self.path = os.path.join(directory, self.id)
+        self.spans = []
+        self._cpu = None
+        self._token = None
+
+    def record(self, category: str, name: str, started: float, finished: float, **extra):
+        self.spans.append({
+            "category": category,
+            "name": name,
+            "start_ms": round((started - self.started) * 1000, 3),
+            "duration_ms": round((finished - started) * 1000, 3),
+            **extra
+        })
+
+    def callbacks(self) -> list:
+        """LangChain callbacks timing graph nodes and output parsing"""
+        return [_callback_handler()(self)]
+
+    async def __aenter__(self):
+        global _cpu_busy, _tracing
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _tracing += 1
+        tracemalloc.reset_peak()
+        self._before = await run_in_worker(tracemalloc.take_snapshot)
+        if not _cpu_busy:
+            _cpu_busy = True
+            self._cpu = cProfile.Profile()
+            self._cpu.enable()
+        self._token = _active.set(self)
+        self.started = time.perf_counter()
+        return self
+
+    async def __aexit__(self, *exc):
+        global _cpu_busy, _tracing
+        wall = time.perf_counter() - self.started
+        _active.reset(self._token)
+        if self._cpu is not None:
+            self._cpu.disable()
+            _cpu_busy = False
+        current, peak = tracemalloc.get_traced_memory()
+        try:
+            after = await run_in_worker(tracemalloc.take_snapshot)
+        finally:
+            _tracing -= 1
+            if _tracing == 0:
+                tracemalloc.stop()
+        try:
+            await run_in_worker(self._write, wall, after, current, peak, exc[0])
+        except Exception:
+            logger.exception("Writing profile %s failed", self.id)
+        return False
+
+    def _breakdown(self) -> dict:
+        breakdown = {}
+        for item in self.spans:
+            entry = breakdown.setdefault(item["category"], {"count": 0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] = round(entry["total_ms"] + item["duration_ms"], 3)
+        return breakdown
+
+    def _cpu_top(self) -> list:
+        if self._cpu is None:
+            return []
+        stats = pstats.Stats(self._cpu, stream=io.StringIO())
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+        return [
+            {
+                "function": f"{filename}:{line}({name})",
+                "calls": calls,
+                "self_ms": round(self_time * 1000, 3),
+                "cumulative_ms": round(cumulative * 1000, 3)
+            }
+            for (filename, line, name), (_, calls, self_time, cumulative, _) in rows[:TOP_FUNCTIONS]
+        ]
+
+    def _write(self, wall: float, after, current: int, peak: int, error):
+        os.makedirs(self.path, exist_ok=True)
+        if self._cpu is not None:
+            self._cpu.dump_stats(os.path.join(self.path, "cpu.prof"))
+
+        growth = after.compare_to(self._before, "lineno")
+        summary = {
+            "id": self.id,
+            "label": self.label,
+            "wall_ms": round(wall * 1000, 3),
+            "error": error.__name__ if error else None,
+            "cpu_profiled": self._cpu is not None,
+            "breakdown": self._breakdown(),
+            "spans": self.spans,
+            "cpu_top": self._cpu_top(),
+            "memory": {
+                "traced_bytes": current,
+                "peak_bytes": peak,
+                "top_growth": [
+                    {
+                        "location": str(stat.traceback),
+                        "size_diff": stat.size_diff,
+                        "count_diff": stat.count_diff
+                    }
+                    for stat in growth[:TOP_ALLOCATIONS]
+                ]
+            }
+        }
+        with open(os.path.join(self.path, "summary.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+_handler_class = None
+
+
+def _callback_handler():
+    """LangChain callback handler class, defined on first use to keep imports lazy"""
+    global _handler_class
+    if _handler_class is None:
+        from langchain_core.callbacks import BaseCallbackHandler
+
+        class ProfileCallbackHandler(BaseCallbackHandler):
+            run_inline = True
+
+            def __init__(self, profile: RequestProfile):
+                self.profile = profile
+                self._runs = {}
+
+            def on_chain_start(self, serialized, inputs, *, run_id, metadata=None, **kwargs):
+                name = kwargs.get("name")
+                if kwargs.get("run_type") == "parser":
+                    self._runs[run_id] = ("parse_json", name, time.perf_counter())
+                elif name and not name.startswith("__") and name == (metadata or {}).get("langgraph_node"):
+                    self._runs[run_id] = ("node", name, time.perf_counter())
+
+            def _finish(self, run_id, error: bool):
+                run = self._runs.pop(run_id, None)
+                if run is not None:
+                    category, name, started = run
+                    self.profile.record(category, name, started, time.perf_counter(), error=error)
+
+            def on_chain_end(self, outputs, *, run_id, **kwargs):
+                self._finish(run_id, False)
+
+            def on_chain_error(self, error, *, run_id, **kwargs):
+                self._finish(run_id, True)
+
+        _handler_class = ProfileCallbackHandler
+    return _handler_class
+
+
+def request_profile(request, label: str):
+    """Profile for a request that asked for one, or None
+
+    Profiling must be enabled with PROFILING_ENABLED and requested with
+    the X-Profile header or the ``profile`` query parameter.
+    """
+    if not config.PROFILING_ENABLED:
+        return None
+    flag = request.headers.get(PROFILE_HEADER) or request.query_params.get("profile") or ""
+    if flag.lower() not in _TRUTHY:
+        return None
+    return RequestProfile(label, config.PROFILE_DIR)
+
+
+def profile_config(profile) -> dict:
+    """Graph run config that reports node and parser timings to a profile"""
+    return {"callbacks": profile.callbacks()} if profile is not None else None
@@ -0,0 +1,79 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from app import config
+from .docx_templates import RENDERER_VERSION, get_template
+
+
+class RenderCache:
+    """Thread-safe LRU of rendered documents, bounded by their total size"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str):
+        with self._lock:
+            document = self._entries.get(key)
+            if document is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return document
+
+    def set(self, key: str, document: bytes):
+        if len(document) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= len(self._entries.pop(key))
+            self._entries[key] = document
+            self._size += len(document)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        """Return hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._size
+        }
+
+
+render_cache = RenderCache(config.RENDER_CACHE_MAX_BYTES)
+
+
+def render_key(data: dict, template) -> str:
+    """Canonical hash of the resume, the template and the renderer version"""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    digest = hashlib.sha256(canonical.encode("utf-8"))
+    digest.update(f"\0{template.name}\0{template.fingerprint}\0{RENDERER_VERSION}".encode())
+    return digest.hexdigest()
+
+
+def render_cached(data: dict, template: str = None) -> bytes:
+    """Render a resume, reusing the stored document for identical inputs"""
+    template = get_template(template)
+    if not config.RENDER_CACHE_ENABLED:
+        return template.render(data)
+    
+    key = render_key(data or {}, template)
+    document = render_cache.get(key)
+    if document is None:
+        document = template.render(data)
+        render_cache.set(key, document)
+    return document
@@ -0,0 +1,59 @@
+import time
+from collections import OrderedDict
+from app import config
+
+
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+class RenderStore:
+    """Short-lived in-memory store for rendered documents, keyed by filename
+
+    Entries expire after ``ttl_seconds``; the oldest are dropped once the
+    stored documents exceed ``max_bytes`` in total.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: int):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._size = 0
+
+    def _drop(self, name: str):
+        document, _ = self._entries.pop(name)
+        self._size -= len(document)
+
+    def _expire(self):
+        now = time.time()
+        while self._entries:
+            name, (_, expires_at) = next(iter(self._entries.items()))
+            if expires_at > now and self._size <= self.max_bytes:
+                break
+            self._drop(name)
+
+    def put(self, name: str, document: bytes):
+        """Keep a rendered document for ``ttl_seconds``"""
+        if name in self._entries:
+            self._drop(name)
+        if len(document) > self.max_bytes:
+            return
+        self._entries[name] = (document, time.time() + self.ttl_seconds)
+        self._size += len(document)
+        self._expire()
+
+    def get(self, name: str):
+        """Return a stored document, or None once it has expired"""
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            self._drop(name)
+            return None
+        return entry[0]
+
+    def stats(self) -> dict:
+        self._expire()
+        return {"documents": len(self._entries), "bytes": self._size}
+
+
+render_store = RenderStore(config.RENDER_STORE_MAX_BYTES, config.RENDER_HANDLE_TTL_SECONDS)
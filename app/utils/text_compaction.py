@@ -0,0 +1,119 @@
+import re
+import unicodedata
+from collections import Counter
+
+
+# Rough characters-per-token ratio for English text with Llama-style tokenizers
+CHARS_PER_TOKEN = 4
+
+# Lines this close to the top or bottom of a page are header/footer candidates
+EDGE_LINES = 3
+
+# A candidate repeated on at least this share of pages is treated as boilerplate
+BOILERPLATE_PAGE_SHARE = 0.6
+
+_PAGE_NUMBER_RE = re.compile(r"^(page\s*)?\d{1,4}(\s*(of|/)\s*\d{1,4})?$", re.IGNORECASE)
+_PAGE_LABEL_RE = re.compile(r"\bpage\s*\d{1,4}(\s*(of|/)\s*\d{1,4})?\b", re.IGNORECASE)
+_HYPHEN_BREAK_RE = re.compile(r"(\w)-\n[ \t]*([a-z])")
+_SPACES_RE = re.compile(r"[ \t\u00a0\u2000-\u200b]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in text"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _line_signature(line: str) -> str:
+    """Normalize a line for comparison; lines with a page label match whatever the page number"""
+    line = " ".join(line.lower().split())
+    return _DIGITS_RE.sub("#", line) if _PAGE_LABEL_RE.search(line) else line
+
+
+def _strip_boilerplate(pages: list) -> tuple:
+    """Drop page numbers and later copies of header/footer lines repeated across pages"""
+    pages = [[line.strip() for line in page.split("\n")] for page in pages]
+
+    # Indexes of the first and last few non-empty lines of each page
+    edges = []
+    for lines in pages:
+        content = [i for i, line in enumerate(lines) if line]
+        edges.append(set(content[:EDGE_LINES] + content[-EDGE_LINES:]))
+
+    # Only text with several pages has headers, footers or page numbers; a
+    # bare number is treated as a page number only when most pages end in one
+    repeated = set()
+    strip_numbers = False
+    if len(pages) >= 2:
+        counts = Counter()
+        numbered = 0
+        for lines, indexes in zip(pages, edges):
+            counts.update({_line_signature(lines[i]) for i in indexes})
+            numbered += any(_PAGE_NUMBER_RE.match(lines[i]) for i in indexes)
+        threshold = max(2, BOILERPLATE_PAGE_SHARE * len(pages))
+        repeated = {signature for signature, count in counts.items() if count >= threshold}
+        strip_numbers = numbered >= threshold
+
+    # The first copy of a running header is kept, as it is often the name and
+    # contact line; lines with a page label carry nothing worth keeping
+    removed = 0
+    seen = set()
+    kept_pages = []
+    for lines, indexes in zip(pages, edges):
+        kept = []
+        for i, line in enumerate(lines):
+            if i in indexes:
+                signature = _line_signature(line)
+                if strip_numbers and _PAGE_NUMBER_RE.match(line) or signature in repeated and (
+                        signature in seen or _PAGE_LABEL_RE.search(line)):
+                    removed += 1
+                    continue
+                seen.add(signature)
+            kept.append(line)
+        kept_pages.append("\n".join(kept))
+    return kept_pages, removed
+
+
+def _truncate(text: str, token_budget: int) -> str:
+    """Cut text to the token budget, preferring a line boundary"""
+    limit = token_budget * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit)
+    return text[:cut if cut > limit // 2 else limit].rstrip()
+
+
+def compact_resume_text(text: str, token_budget: int = None) -> tuple:
+    """Shrink extracted resume text before it is sent to the LLM
+
+    Normalizes unicode, removes repeated per-page headers/footers and page
+    numbers, joins words hyphenated across line breaks, collapses
+    whitespace and finally caps the text at ``token_budget`` tokens.
+    Returns the compacted text and a dict of before/after statistics.
+    """
+    text = text or ""
+    tokens_before = estimate_tokens(text)
+
+    compacted = unicodedata.normalize("NFKC", text).replace("\r\n", "\n").replace("\r", "\n")
+    pages, boilerplate_removed = _strip_boilerplate(compacted.split("\f"))
+    compacted = "\n".join(pages)
+    compacted = _HYPHEN_BREAK_RE.sub(r"\1\2", compacted)
+    compacted = _SPACES_RE.sub(" ", compacted)
+    compacted = "\n".join(line.strip() for line in compacted.split("\n"))
+    compacted = _BLANK_LINES_RE.sub("\n\n", compacted).strip()
+
+    truncated = False
+    if token_budget and estimate_tokens(compacted) > token_budget:
+        compacted = _truncate(compacted, token_budget)
+        truncated = True
+
+    return compacted, {
+        "tokens_before": tokens_before,
+        "tokens_after": estimate_tokens(compacted),
+        "chars_before": len(text),
+        "chars_after": len(compacted),
+        "pages": len(pages),
+        "boilerplate_lines_removed": boilerplate_removed,
+        "truncated": truncated
+    }
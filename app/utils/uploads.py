@@ -0,0 +1,95 @@
+import hashlib
+import os
+import uuid
+from typing import NamedTuple
+import filetype
+from app import config
+from .artifacts import upload_store
+from .concurrency import run_in_worker
+
+
+CHUNK_SIZE = 1024 * 1024
+RESUME_TYPES = ("pdf", "docx")
+
+# Enough leading bytes for filetype to recognise PDF, DOCX and ZIP
+_SNIFF_BYTES = 8192
+
+
+class UploadRejected(Exception):
+    """Raised when an upload is too large or not an accepted file type"""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class StoredUpload(NamedTuple):
+    """A validated upload; ``source`` is the saved path or the in-memory file"""
+    path: str
+    filename: str
+    extension: str
+    sha256: str
+    size: int
+    source: object
+
+
+def _too_large(max_bytes: int) -> UploadRejected:
+    return UploadRejected(f"File exceeds the maximum size of {max_bytes} bytes", status_code=413)
+
+
+async def store_upload(file, allowed: tuple = RESUME_TYPES, max_bytes: int = None,
+                       directory: str = None, persist: bool = True) -> StoredUpload:
+    """Stream an upload to disk in chunks, hashing it and checking type and size
+
+    Uploads are stored content-addressed in the upload store unless a
+    ``directory`` is given. With ``persist=False`` nothing is written: the
+    upload is hashed and validated in place and the request's spooled file
+    is returned as ``source`` so text can be extracted straight from it.
+    """
+    max_bytes = max_bytes or config.MAX_UPLOAD_BYTES
+
+    # The multipart parser already knows the size; reject before copying anything
+    if file.size is not None and file.size > max_bytes:
+        raise _too_large(max_bytes)
+
+    head = await file.read(_SNIFF_BYTES)
+    kind = filetype.guess(head)
+    if kind is None or kind.extension not in allowed:
+        raise UploadRejected(f"Unsupported file format, expected one of: {', '.join(allowed)}", 415)
+
+    digest = hashlib.sha256(head)
+    size = len(head)
+
+    if not persist:
+        while chunk := await file.read(CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_bytes:
+                raise _too_large(max_bytes)
+            digest.update(chunk)
+        await file.seek(0)
+        return StoredUpload(None, file.filename or "", kind.extension, digest.hexdigest(), size, file.file)
+
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{uuid.uuid4().hex}.{kind.extension}")
+    else:
+        path = upload_store.temp_path(kind.extension)
+
+    try:
+        with open(path, "wb") as f:
+            await run_in_worker(f.write, head)
+            while chunk := await file.read(CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise _too_large(max_bytes)
+                digest.update(chunk)
+                await run_in_worker(f.write, chunk)
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
+    sha256 = digest.hexdigest()
+    if not directory:
+        path = upload_store.path_for(await run_in_worker(upload_store.adopt, path, sha256, kind.extension))
+    return StoredUpload(path, file.filename or "", kind.extension, sha256, size, path)
@@ -1,15 +1,26 @@
-from .nodes import (
-    parse_resume_node,
-    ats_score_node,
-    enhance_resume_node,
-    generate_resume_node
-)
-from .graph_builder import build_workflow
-
-__all__ = [
-    "parse_resume_node",
-    "ats_score_node",
-    "enhance_resume_node",
-    "generate_resume_node",
-    "build_workflow"
-]
+import importlib
+
+# Exported names and the submodule defining each; submodules are imported on
+# first attribute access so importing app.workflow does not load langchain
+_EXPORTS = {
+    "compact_text_node": "nodes",
+    "parse_resume_node": "nodes",
+    "ats_score_node": "nodes",
+    "enhance_resume_node": "nodes",
+    "ats_enhance_node": "nodes",
+    "enhance_section_node": "nodes",
+    "reuse_sections_node": "nodes",
+    "merge_sections_node": "nodes",
+    "generate_resume_node": "nodes",
+    "build_workflow": "graph_builder"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
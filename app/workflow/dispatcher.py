@@ -0,0 +1,197 @@
+import asyncio
+import time
+from langchain_core.runnables import Runnable
+from app.utils.profiling import span
+
+
+# Rough characters-per-token ratio used to estimate prompt size
+CHARS_PER_TOKEN = 4
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously up to a per-minute quota"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float):
+        """Wait until amount tokens are available and take them"""
+        if self.capacity <= 0:
+            return
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def charge(self, amount: float):
+        """Take tokens after the fact (may go negative, delaying later callers)"""
+        if self.capacity > 0:
+            self._refill()
+            self.tokens -= amount
+
+    def available(self, amount: float) -> bool:
+        """Whether amount tokens could be taken right now"""
+        if self.capacity <= 0:
+            return True
+        self._refill()
+        return self.tokens >= min(amount, self.capacity)
+
+
+def _prompt_text(prompt) -> str:
+    if hasattr(prompt, "to_string"):
+        return prompt.to_string()
+    return str(prompt)
+
+
+class ProviderQuota:
+    """Request and token buckets every call to the provider is charged to
+
+    Shared by the dispatcher, which charges each prompt once before it is
+    sent, and the resilience layer, which charges its retries and hedged
+    duplicates as well.
+    """
+
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0,
+                 completion_tokens: int = 512):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.completion_tokens = completion_tokens
+
+    def estimate(self, prompt) -> float:
+        """Prompt tokens plus the expected completion"""
+        return len(_prompt_text(prompt)) / CHARS_PER_TOKEN + self.completion_tokens
+
+    async def acquire(self, prompts: list) -> list:
+        """Wait until the prompts fit the quota and charge them, returning their estimates"""
+        estimates = [self.estimate(prompt) for prompt in prompts]
+        await self.requests.acquire(len(prompts))
+        await self.tokens.acquire(sum(estimates))
+        return estimates
+
+    def try_acquire(self, prompt) -> bool:
+        """Charge one prompt only if the quota allows it right now"""
+        estimate = self.estimate(prompt)
+        if not (self.requests.available(1) and self.tokens.available(estimate)):
+            return False
+        self.requests.charge(1)
+        self.tokens.charge(estimate)
+        return True
+
+    def settle(self, estimate: float, result):
+        """Correct a charge once the provider reports the tokens actually used"""
+        usage = getattr(result, "usage_metadata", None)
+        if usage:
+            self.tokens.charge(usage.get("total_tokens", estimate) - estimate)
+
+
+class LLMDispatcher(Runnable):
+    """Shared front for the chat model used by every workflow node
+
+    Identical prompts that are already in flight share one call, and
+    ``quota`` keeps the process under the provider's per-minute request and
+    token limits. Calls made in the same event loop iteration (or within
+    ``window_ms``, when set) form one batch, which acquires its quota
+    together; ``abatch`` still sends one provider request per prompt.
+    """
+
+    def __init__(self, llm, max_batch: int = 8, window_ms: int = 0, quota: ProviderQuota = None):
+        self.llm = llm
+        self.max_batch = max(max_batch, 1)
+        self.window = window_ms / 1000
+        self.quota = quota or ProviderQuota()
+        self._inflight = {}
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+        self.calls = 0
+        self.coalesced = 0
+        self.batches = 0
+
+    def invoke(self, input, config=None, **kwargs):
+        """Synchronous calls go straight to the model"""
+        return self.llm.invoke(input, config, **kwargs)
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        node = ((config or {}).get("metadata") or {}).get("llm_node", "default")
+        # Timed as the caller sees it: batching window and quota waits included
+        with span("llm", node):
+            return await self._submit(input, config)
+
+    async def _submit(self, input, config):
+        self.calls += 1
+        text = _prompt_text(input)
+        future = self._inflight.get(text)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[text] = future
+        self._pending.append((text, input, config, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None and self.window > 0:
+            self._timer = loop.call_later(self.window, self._flush)
+        elif self._timer is None:
+            # No window: flush as soon as the callers already scheduled have run
+            self._timer = loop.call_soon(self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self):
+        """Dispatch everything collected in the current window"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: list):
+        try:
+            estimates = await self.quota.acquire([text for text, *_ in batch])
+            self.batches += 1
+            results = await self.llm.abatch(
+                [input for _, input, _, _ in batch],
+                config=[config or {} for _, _, config, _ in batch],
+                return_exceptions=True
+            )
+            for (_, _, _, future), result, estimate in zip(batch, results, estimates):
+                self.quota.settle(estimate, result)
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        except BaseException as e:
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            for text, *_ in batch:
+                self._inflight.pop(text, None)
+
+    def stats(self) -> dict:
+        """Return dispatcher counters"""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "inflight": len(self._inflight)
+        }
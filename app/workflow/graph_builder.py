@@ -1,33 +1,114 @@
 from langgraph.graph import StateGraph
+from langgraph.types import Send
+from app import config
 from app.models import ResumeState
+from app.utils.metrics import timed_node
 from .nodes import (
+    compact_text_node,
     parse_resume_node,
     ats_score_node,
     enhance_resume_node,
+    ats_enhance_node,
+    enhance_section_node,
+    reuse_sections_node,
+    merge_sections_node,
     generate_resume_node
 )
+from .sections import split_sections
 
 
-def build_workflow():
-    """Build and compile the LangGraph workflow"""
+def route_entry(state: ResumeState) -> str:
+    """Skip compaction and parsing when the caller already supplies structured data"""
+    if state.get("parsed_data"):
+        return "score"
+    return "compact"
+
+
+def route_enhance(state: ResumeState):
+    """Fan long resumes out to one enhancement call per section
+
+    When earlier results were reused for some sections, only the
+    remaining sections are sent, however short the resume is.
+    """
+    parts = split_sections(state["parsed_data"])
+    reused = state.get("enhanced_sections") or {}
+    if reused:
+        parts = [part for part in parts if part[0] not in reused]
+        if not parts:
+            return "merge_sections"
+    elif len(parts) < max(config.ENHANCE_FANOUT_MIN_SECTIONS, 1):
+        return "enhance"
+    
+    missing_keywords = (state.get("ats_score") or {}).get("missing_keywords") or []
+    return [
+        Send("enhance_section", {
+            "key": key,
+            "section": section,
+            "content": content,
+            "missing_keywords": missing_keywords
+        })
+        for key, section, content in parts
+    ]
+
+
+def build_workflow(render: bool = True, fused: bool = False):
+    """Build and compile the LangGraph workflow
+
+    The graph starts at ``compact`` for raw text and at scoring when
+    ``parsed_data`` is already filled in. With ``fused=True`` scoring and
+    enhancement run as the single ``ats_enhance`` LLM call instead of
+    ``ats_score_analysis`` followed by ``enhance``; otherwise resumes with
+    many sections are enhanced section by section in parallel and merged
+    in ``merge_sections``, and sections enhanced by an earlier request are
+    reused by ``reuse_sections`` so only changed ones reach the LLM. With
+    ``render=False`` the graph stops after enhancement and no DOCX is
+    generated.
+    """
     
     # Create StateGraph
     workflow = StateGraph(ResumeState)
     
+    def add_node(name, node):
+        workflow.add_node(name, timed_node(name, node) if config.METRICS_ENABLED else node)
+    
     # Add nodes
-    workflow.add_node("parse", parse_resume_node)
-    workflow.add_node("ats_score_analysis", ats_score_node)
-    workflow.add_node("enhance", enhance_resume_node)
-    workflow.add_node("generate", generate_resume_node)
+    add_node("compact", compact_text_node)
+    add_node("parse", parse_resume_node)
+    if fused:
+        add_node("ats_enhance", ats_enhance_node)
+        score_node, last_nodes = "ats_enhance", ["ats_enhance"]
+    else:
+        add_node("ats_score_analysis", ats_score_node)
+        add_node("enhance", enhance_resume_node)
+        add_node("reuse_sections", reuse_sections_node)
+        add_node("enhance_section", enhance_section_node)
+        add_node("merge_sections", merge_sections_node)
+        workflow.add_edge("ats_score_analysis", "reuse_sections")
+        workflow.add_conditional_edges(
+            "reuse_sections", route_enhance, ["enhance", "enhance_section", "merge_sections"]
+        )
+        workflow.add_edge("enhance_section", "merge_sections")
+        score_node, last_nodes = "ats_score_analysis", ["enhance", "merge_sections"]
     
     # Add edges (workflow flow)
-    workflow.add_edge("parse", "ats_score_analysis")
-    workflow.add_edge("ats_score_analysis", "enhance")
-    workflow.add_edge("enhance", "generate")
+    workflow.add_edge("compact", "parse")
+    workflow.add_edge("parse", score_node)
+    
+    # Set entry point based on the input state
+    workflow.set_conditional_entry_point(
+        route_entry,
+        {"compact": "compact", "score": score_node}
+    )
     
-    # Set entry and finish points
-    workflow.set_entry_point("parse")
-    workflow.set_finish_point("generate")
+    # Finish after rendering, or right after enhancement
+    if render:
+        add_node("generate", generate_resume_node)
+        for node in last_nodes:
+            workflow.add_edge(node, "generate")
+        workflow.set_finish_point("generate")
+    else:
+        for node in last_nodes:
+            workflow.set_finish_point(node)
     
     # Compile and return
     graph = workflow.compile()
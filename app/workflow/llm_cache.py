@@ -0,0 +1,70 @@
+import hashlib
+import json
+from app import config
+from app.utils.cache import ResultCache
+from .llm_config import MODEL_NAME
+from .sections import section_fingerprint
+
+
+llm_cache = ResultCache(
+    config.CACHE_DB_PATH,
+    namespace="llm",
+    memory_entries=config.LLM_CACHE_MEMORY_ENTRIES,
+    max_entries=config.LLM_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.LLM_CACHE_TTL_SECONDS
+)
+
+
+# Enhanced sections stored by the fingerprint of their original content
+section_cache = ResultCache(
+    config.CACHE_DB_PATH,
+    namespace="sections",
+    memory_entries=config.LLM_CACHE_MEMORY_ENTRIES,
+    max_entries=config.LLM_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.LLM_CACHE_TTL_SECONDS
+)
+
+
+def _normalize(value):
+    """Collapse whitespace in strings so cosmetic differences share a key"""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def cache_key(node: str, prompt_version: str, inputs: dict) -> str:
+    """Hash the normalized inputs together with the prompt version and model"""
+    payload = json.dumps(
+        [node, prompt_version, MODEL_NAME, _normalize(inputs)],
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def cached_ainvoke(node: str, prompt_version: str, chain, inputs: dict):
+    """Invoke chain, reusing a stored result for identical inputs"""
+    # The node name selects the LLM timeout in ResilientLLM
+    run_config = {"metadata": {"llm_node": node}}
+    if not config.LLM_CACHE_ENABLED:
+        return await chain.ainvoke(inputs, config=run_config)
+
+    key = cache_key(node, prompt_version, inputs)
+    result = await llm_cache.get(key)
+    if result is not None:
+        return result
+
+    result = await chain.ainvoke(inputs, config=run_config)
+    await llm_cache.set(key, result)
+    return result
+
+
+def section_cache_key(section: str, content, prompt_version: str, keywords=None) -> str:
+    """Key an enhanced section by its original content, the keywords it was
+    tailored to (from the ATS analysis of the job description), prompt version and model"""
+    targets = sorted({" ".join(str(k).lower().split()) for k in keywords or []})
+    return section_fingerprint(section, [_normalize(content), targets], f"{prompt_version}:{MODEL_NAME}")
@@ -1,7 +1,67 @@
-from langchain_groq import ChatGroq
-from dotenv import load_dotenv
+from app import config
+from .providers import create_chat_model, model_name
 
-load_dotenv()
+# Name of the configured model; known without creating the client
+MODEL_NAME = model_name(config.LLM_PROVIDER)
 
-# Initialize LLM
-llm = ChatGroq(model="llama-3.1-8b-instant", temperature=0.2)
+_chat_model = None
+_quota = None
+_resilient_model = None
+_llm = None
+
+
+def get_chat_model():
+    """Return the raw provider client, creating it on first use"""
+    global _chat_model
+    if _chat_model is None:
+        _chat_model = create_chat_model(
+            config.LLM_PROVIDER,
+            latency_ms=config.STUB_LLM_LATENCY_MS,
+            responses_path=config.STUB_LLM_RESPONSES
+        )
+    return _chat_model
+
+
+def get_quota():
+    """Return the provider quota shared by the dispatcher and the resilience layer"""
+    global _quota
+    if _quota is None:
+        from .dispatcher import ProviderQuota
+        _quota = ProviderQuota(
+            requests_per_minute=config.LLM_REQUESTS_PER_MINUTE,
+            tokens_per_minute=config.LLM_TOKENS_PER_MINUTE,
+            completion_tokens=config.LLM_COMPLETION_TOKEN_ESTIMATE
+        )
+    return _quota
+
+
+def get_resilient_model():
+    """Return the client wrapped with timeouts, retries, hedging and circuit breaking"""
+    global _resilient_model
+    if _resilient_model is None:
+        from .resilience import CircuitBreaker, ResilientLLM
+        _resilient_model = ResilientLLM(
+            get_chat_model(),
+            timeouts=config.LLM_NODE_TIMEOUTS,
+            default_timeout=config.LLM_TIMEOUT_SECONDS,
+            max_retries=config.LLM_MAX_RETRIES,
+            hedge=config.LLM_HEDGE_ENABLED,
+            hedge_min_samples=config.LLM_HEDGE_MIN_SAMPLES,
+            breaker=CircuitBreaker(config.LLM_BREAKER_THRESHOLD, config.LLM_BREAKER_COOLDOWN_SECONDS),
+            quota=get_quota()
+        )
+    return _resilient_model
+
+
+def get_llm():
+    """Return the shared dispatcher every node calls the model through"""
+    global _llm
+    if _llm is None:
+        from .dispatcher import LLMDispatcher
+        _llm = LLMDispatcher(
+            get_resilient_model(),
+            max_batch=config.LLM_MAX_BATCH,
+            window_ms=config.LLM_BATCH_WINDOW_MS,
+            quota=get_quota()
+        )
+    return _llm
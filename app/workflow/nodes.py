@@ -1,14 +1,44 @@
+import asyncio
 import json
 from langchain.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.exceptions import OutputParserException
+from app import config
 from app.models import ResumeState
-from app.utils import save_resume_docx
-from .llm_config import llm
+from app.utils import run_in_worker
+from app.utils.render_cache import render_cached
+from app.utils.artifacts import artifact_name, output_store
+from app.utils.render_store import render_store
+from app.utils.profiling import span
+from app.utils.ats_scorer import score_resume
+from app.utils.text_compaction import compact_resume_text
+from .llm_config import get_llm
+from .llm_cache import cached_ainvoke, section_cache, section_cache_key
+from .sections import ENTRY_IDENTITY_FIELDS, merge_sections, split_sections
+
+
+# Bump a prompt version whenever its template changes so cached results are not reused
+PARSE_PROMPT_VERSION = "1"
+ATS_PROMPT_VERSION = "1"
+ENHANCE_PROMPT_VERSION = "1"
+ATS_ENHANCE_PROMPT_VERSION = "1"
+SECTION_PROMPT_VERSION = "1"
+
+
+# -------- Node: Compact Text --------
+async def compact_text_node(state: ResumeState) -> ResumeState:
+    """Shrink extracted text (boilerplate, hyphenation, whitespace) before parsing"""
+    if not config.COMPACTION_ENABLED:
+        return state
+    
+    raw_text, stats = compact_resume_text(state["raw_text"], config.PARSE_TOKEN_BUDGET)
+    state["raw_text"] = raw_text
+    state["compaction"] = stats
+    return state
 
 
 # -------- Node: Parse Resume --------
-def parse_resume_node(state: ResumeState) -> ResumeState:
+async def parse_resume_node(state: ResumeState) -> ResumeState:
     """Parse raw resume text into structured data"""
     
     # Validation
@@ -43,10 +73,12 @@ def parse_resume_node(state: ResumeState) -> ResumeState:
     )
     
     parser = JsonOutputParser()
-    chain = prompt | llm | parser
+    chain = prompt | get_llm() | parser
     
     try:
-        parsed_data = chain.invoke({"resume_text": state["raw_text"]})
+        parsed_data = await cached_ainvoke(
+            "parse", PARSE_PROMPT_VERSION, chain, {"resume_text": state["raw_text"]}
+        )
     except OutputParserException as e:
         raise Exception(f"Failed to parse resume as JSON: {str(e)}")
     
@@ -55,8 +87,12 @@ def parse_resume_node(state: ResumeState) -> ResumeState:
 
 
 # -------- Node: Calculate ATS Score --------
-def ats_score_node(state: ResumeState) -> ResumeState:
+async def ats_score_node(state: ResumeState) -> ResumeState:
     """Calculate ATS score for resume"""
+    if config.ATS_SCORER != "llm":
+        state["ats_score"] = score_resume(state["parsed_data"], state.get("job_description", ""))
+        return state
+    
     prompt = PromptTemplate(
         input_variables=["resume_data"],
         template="""
@@ -74,10 +110,12 @@ def ats_score_node(state: ResumeState) -> ResumeState:
     )
     
     parser = JsonOutputParser()
-    chain = prompt | llm | parser
+    chain = prompt | get_llm() | parser
     
     try:
-        ats_data = chain.invoke({"resume_data": json.dumps(state["parsed_data"])})
+        ats_data = await cached_ainvoke(
+            "ats", ATS_PROMPT_VERSION, chain, {"resume_data": json.dumps(state["parsed_data"])}
+        )
     except OutputParserException as e:
         ats_data = {
             "score": 0,
@@ -91,7 +129,7 @@ def ats_score_node(state: ResumeState) -> ResumeState:
 
 
 # -------- Node: Enhance Resume --------
-def enhance_resume_node(state: ResumeState) -> ResumeState:
+async def enhance_resume_node(state: ResumeState) -> ResumeState:
     """Enhance resume with AI improvements"""
     prompt = PromptTemplate(
         input_variables=["resume_data", "ats_feedback"],
@@ -122,27 +160,220 @@ def enhance_resume_node(state: ResumeState) -> ResumeState:
     )
     
     parser = JsonOutputParser()
-    chain = prompt | llm | parser
+    chain = prompt | get_llm() | parser
     
     try:
-        enhanced_data = chain.invoke({
+        enhanced_data = await cached_ainvoke("enhance", ENHANCE_PROMPT_VERSION, chain, {
             "resume_data": json.dumps(state["parsed_data"]),
             "ats_feedback": json.dumps(state["ats_score"])
         })
     except OutputParserException as e:
         enhanced_data = state["parsed_data"]
+    else:
+        await _remember_sections(state["parsed_data"], enhanced_data, _missing_keywords(state))
     
     state["enhanced_data"] = enhanced_data
     return state
 
 
+def _missing_keywords(state: ResumeState) -> list:
+    """Keywords the ATS analysis asked for; enhanced sections are tailored to them"""
+    return (state.get("ats_score") or {}).get("missing_keywords") or []
+
+
+def _same_entry(original, enhanced) -> bool:
+    """Whether an enhanced list entry still describes the original one (same title and company)"""
+    if not isinstance(original, dict):
+        return True
+    return all(
+        " ".join(str(original.get(field) or "").lower().split())
+        == " ".join(str(enhanced.get(field) or "").lower().split())
+        for field in ENTRY_IDENTITY_FIELDS
+    )
+
+
+async def _remember_sections(original: dict, enhanced: dict, keywords: list):
+    """Store each enhanced section under the fingerprint of its original content and keywords"""
+    if not config.INCREMENTAL_ENHANCE or not isinstance(enhanced, dict):
+        return
+    enhanced_parts = {key: content for key, _, content in split_sections(enhanced)}
+    for key, section, content in split_sections(original):
+        improved = enhanced_parts.get(key)
+        if not isinstance(improved, type(content)):
+            continue
+        # Entries are matched by position, so a list must keep its length and
+        # each entry its identity, or another entry's text would be stored
+        if ":" in key and (
+            len(original.get(section) or []) != len(enhanced.get(section) or [])
+            or not _same_entry(content, improved)
+        ):
+            continue
+        await section_cache.set(
+            section_cache_key(section, content, SECTION_PROMPT_VERSION, keywords), {"content": improved}
+        )
+
+
+# -------- Node: Reuse Enhanced Sections --------
+async def reuse_sections_node(state: ResumeState) -> ResumeState:
+    """Fill in sections whose content was already enhanced in an earlier request
+
+    Only sections without a stored result are then sent to the LLM.
+    """
+    reused = {}
+    if config.INCREMENTAL_ENHANCE:
+        parts = split_sections(state["parsed_data"])
+        keywords = _missing_keywords(state)
+        stored = await asyncio.gather(*(
+            section_cache.get(section_cache_key(section, content, SECTION_PROMPT_VERSION, keywords))
+            for _, section, content in parts
+        ))
+        reused = {
+            key: result["content"]
+            for (key, _, _), result in zip(parts, stored)
+            if result is not None
+        }
+    
+    state["enhanced_sections"] = reused
+    return state
+
+
+# -------- Node: Enhance One Section (fan-out) --------
+async def enhance_section_node(payload: dict) -> dict:
+    """Enhance a single resume section sent by the enhancement fan-out"""
+    prompt = PromptTemplate(
+        input_variables=["section", "keywords", "content"],
+        template="""
+        Improve this part of a resume ({section}) to increase ATS score and professional impact.
+        Keep names, companies, dates and facts unchanged. Use strong action verbs and
+        quantify results where the text supports it.
+        Keywords worth including where truthful: {keywords}
+        Section: {content}
+        
+        Return ONLY valid JSON with the improved section in exactly the same structure as the input:
+        {{"content": <improved section>}}
+        """
+    )
+    
+    parser = JsonOutputParser()
+    chain = prompt | get_llm() | parser
+    original = payload["content"]
+    
+    try:
+        result = await cached_ainvoke("enhance_section", SECTION_PROMPT_VERSION, chain, {
+            "section": payload["section"],
+            "keywords": ", ".join(payload.get("missing_keywords") or []),
+            "content": json.dumps(original)
+        })
+        content = result.get("content") if isinstance(result, dict) else None
+    except OutputParserException:
+        content = None
+    
+    # Keep the original when the model changes the section's shape or the entry's identity
+    if not isinstance(content, type(original)) or not _same_entry(original, content):
+        content = original
+    elif config.INCREMENTAL_ENHANCE:
+        await section_cache.set(
+            section_cache_key(
+                payload["section"], original, SECTION_PROMPT_VERSION, payload.get("missing_keywords")
+            ),
+            {"content": content}
+        )
+    
+    return {"enhanced_sections": {payload["key"]: content}}
+
+
+# -------- Node: Merge Enhanced Sections --------
+async def merge_sections_node(state: ResumeState) -> ResumeState:
+    """Merge the independently enhanced sections back into one resume"""
+    state["enhanced_data"] = merge_sections(state["parsed_data"], state.get("enhanced_sections") or {})
+    return state
+
+
+# -------- Node: Fused ATS Score + Enhance --------
+async def ats_enhance_node(state: ResumeState) -> ResumeState:
+    """Score and enhance the resume with a single LLM call
+
+    Fills ``ats_score`` and ``enhanced_data`` exactly like ``ats_score_node``
+    followed by ``enhance_resume_node``, but sends the resume only once.
+    """
+    prompt = PromptTemplate(
+        input_variables=["resume_data", "job_description"],
+        template="""
+        Analyze this resume for ATS (Applicant Tracking System) compatibility,
+        then improve it to increase the ATS score and professional impact.
+        Resume: {resume_data}
+        Target job description (may be empty): {job_description}
+        
+        Return ONLY valid JSON with:
+        {{
+            "ats_score": {{
+                "score": <0-100 for the ORIGINAL resume>,
+                "feedback": "string",
+                "improvements": ["string list of improvements"],
+                "missing_keywords": ["string list of keywords to add"]
+            }},
+            "enhanced_data": {{
+                "name": "string",
+                "email": "string",
+                "phone": "string",
+                "linkedin": "string",
+                "summary": "improved professional summary",
+                "experience": [
+                    {{"title": "string", "company": "string", "duration": "string", "description": "enhanced description with action verbs"}}
+                ],
+                "education": [
+                    {{"degree": "string", "field": "string", "institution": "string", "year": "string"}}
+                ],
+                "skills": ["enhanced skill list"],
+                "projects": [
+                    {{"title": "string", "description": "enhanced description"}}
+                ]
+            }}
+        }}
+        """
+    )
+    
+    parser = JsonOutputParser()
+    chain = prompt | get_llm() | parser
+    
+    try:
+        result = await cached_ainvoke("ats_enhance", ATS_ENHANCE_PROMPT_VERSION, chain, {
+            "resume_data": json.dumps(state["parsed_data"]),
+            "job_description": state.get("job_description", "")
+        })
+    except OutputParserException:
+        result = {}
+    
+    ats_data = result.get("ats_score") if isinstance(result, dict) else None
+    enhanced_data = result.get("enhanced_data") if isinstance(result, dict) else None
+    
+    state["ats_score"] = ats_data if isinstance(ats_data, dict) else {
+        "score": 0,
+        "feedback": "Could not calculate ATS score",
+        "improvements": [],
+        "missing_keywords": []
+    }
+    state["enhanced_data"] = enhanced_data if isinstance(enhanced_data, dict) else state["parsed_data"]
+    return state
+
+
 # -------- Node: Generate Resume --------
-def generate_resume_node(state: ResumeState) -> ResumeState:
-    """Generate final resume file"""
+async def generate_resume_node(state: ResumeState) -> ResumeState:
+    """Generate final resume file
+
+    The rendered document is named by its content hash, kept in memory
+    under that name for download and written to the output store only
+    when PERSIST_OUTPUTS is set.
+    """
     
     resume_data = state.get("enhanced_data") or state.get("parsed_data")
-    template = state.get("template", "modern")
+    template = state.get("template") or config.DEFAULT_TEMPLATE
     
-    filepath = save_resume_docx(resume_data, template)
-    state["output_file"] = filepath
+    with span("render", template):
+        document = await run_in_worker(render_cached, resume_data, template)
+    name = artifact_name(document, "docx")
+    render_store.put(name, document)
+    if config.PERSIST_OUTPUTS:
+        await run_in_worker(output_store.put, document, "docx")
+    state["output_file"] = name
     return state
@@ -0,0 +1,42 @@
+import json
+
+
+GROQ_MODEL_NAME = "llama-3.1-8b-instant"
+STUB_MODEL_NAME = "offline-stub"
+
+
+def model_name(provider: str) -> str:
+    """Name of the model behind a provider, without creating a client"""
+    if provider == "stub":
+        return STUB_MODEL_NAME
+    if provider == "groq":
+        return GROQ_MODEL_NAME
+    raise ValueError(f"Unknown LLM provider: {provider}")
+
+
+def create_chat_model(provider: str, latency_ms: int = 0, responses_path: str = ""):
+    """Create the chat model for the configured provider
+
+    Provider SDKs are imported here rather than at module level so they are
+    only loaded when a client is actually needed.
+    """
+    if provider == "stub":
+        from .stub_llm import StubChatModel
+        responses = {}
+        if responses_path:
+            with open(responses_path, encoding="utf-8") as f:
+                responses = json.load(f)
+        return StubChatModel(latency_ms=latency_ms, responses=responses)
+    if provider == "groq":
+        from langchain_groq import ChatGroq
+        # Retries are handled by ResilientLLM
+        return ChatGroq(model=GROQ_MODEL_NAME, temperature=0.2, max_retries=0)
+    raise ValueError(f"Unknown LLM provider: {provider}")
+
+
+async def warm_up_chat_model(model):
+    """Open the provider's HTTP connection ahead of the first request"""
+    client = getattr(getattr(model, "async_client", None), "_client", None)
+    if client is not None and hasattr(client, "models"):
+        # Listing models is free and leaves a pooled TLS connection behind
+        await client.models.list()
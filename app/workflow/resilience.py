@@ -0,0 +1,226 @@
+import asyncio
+import random
+import time
+from collections import deque
+from langchain_core.runnables import Runnable
+from app.utils.metrics import llm_errors, llm_request_duration, llm_tokens
+
+
+# Status codes worth retrying: timeouts, conflicts, rate limits and server errors
+RETRYABLE_STATUS = {408, 409, 429}
+
+# Backoff before retry n is uniform in [0, min(BACKOFF_MAX, BACKOFF_BASE * 2**n)]
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+
+# Recent latencies kept per node for the hedging delay
+LATENCY_WINDOW = 200
+
+
+class LLMTimeoutError(Exception):
+    """Raised when an LLM call exceeds its node's timeout"""
+    status_code = 504
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling the provider while the circuit breaker is open"""
+    status_code = 503
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an error is transient (timeout, connection problem, 429 or 5xx)"""
+    if isinstance(error, (LLMTimeoutError, asyncio.TimeoutError, ConnectionError)):
+        return True
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS or status >= 500
+    name = type(error).__name__
+    return "Timeout" in name or "Connection" in name
+
+
+class LatencyTracker:
+    """Rolling per-node latency samples"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self._samples = {}
+
+    def nodes(self) -> list:
+        return list(self._samples)
+
+    def record(self, node: str, seconds: float):
+        self._samples.setdefault(node, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, node: str, pct: float, min_samples: int = 1):
+        """Return the pct-th percentile latency, or None without enough samples"""
+        samples = self._samples.get(node)
+        if not samples or len(samples) < min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures and lets one trial call through after a cooldown"""
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError unless a call may go through; True for the half-open trial"""
+        state = self.state
+        if state == "open" or (state == "half_open" and self._trial):
+            raise CircuitOpenError("LLM provider is unavailable, try again shortly")
+        if state == "half_open":
+            self._trial = True
+        return self._trial
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+
+    def release(self):
+        """Let another trial through after a trial call ended without an outcome"""
+        self._trial = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial = False
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+class ResilientLLM(Runnable):
+    """Chat model wrapper adding per-node timeouts, jittered retries,
+    p95-based hedged requests and a circuit breaker
+
+    The node is read from ``config["metadata"]["llm_node"]``. The first
+    attempt is charged to ``quota`` by the caller; retries wait for the
+    quota and hedged duplicates are only sent when it has room.
+    """
+
+    def __init__(self, llm, timeouts: dict = None, default_timeout: float = 30,
+                 max_retries: int = 2, hedge: bool = True, hedge_min_samples: int = 20,
+                 breaker: CircuitBreaker = None, quota=None):
+        self.llm = llm
+        self.timeouts = timeouts or {}
+        self.default_timeout = default_timeout
+        self.max_retries = max_retries
+        self.hedge = hedge
+        self.hedge_min_samples = hedge_min_samples
+        self.breaker = breaker or CircuitBreaker()
+        self.quota = quota
+        self.latency = LatencyTracker()
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.timeouts_hit = 0
+
+    def invoke(self, input, config=None, **kwargs):
+        """Synchronous calls go straight to the model"""
+        return self.llm.invoke(input, config, **kwargs)
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        node = ((config or {}).get("metadata") or {}).get("llm_node", "default")
+        timeout = self.timeouts.get(node, self.default_timeout)
+
+        for attempt in range(self.max_retries + 1):
+            if attempt and self.quota is not None:
+                estimate = (await self.quota.acquire([input]))[0]
+            trial = self.breaker.before_call()
+            try:
+                result = await asyncio.wait_for(self._hedged(node, input, config, kwargs), timeout)
+            except asyncio.TimeoutError:
+                self.timeouts_hit += 1
+                error = LLMTimeoutError(f"LLM call for '{node}' timed out after {timeout}s")
+            except Exception as e:
+                error = e
+            except BaseException:
+                # Cancelled: no outcome, but a half-open breaker must not wait on it forever
+                if trial:
+                    self.breaker.release()
+                raise
+            else:
+                self.breaker.record_success()
+                if attempt and self.quota is not None:
+                    self.quota.settle(estimate, result)
+                return result
+
+            llm_errors.inc(node=node, error=type(error).__name__)
+            if not is_retryable(error):
+                # The provider answered; the request itself was rejected
+                self.breaker.record_success()
+                raise error
+            self.breaker.record_failure()
+            if attempt == self.max_retries:
+                raise error
+            self.retries += 1
+            await asyncio.sleep(random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)))
+
+    async def _call(self, node: str, input, config, kwargs):
+        started = time.monotonic()
+        result = await self.llm.ainvoke(input, config, **kwargs)
+        elapsed = time.monotonic() - started
+        self.latency.record(node, elapsed)
+        llm_request_duration.observe(elapsed, node=node)
+        usage = getattr(result, "usage_metadata", None) or {}
+        llm_tokens.inc(usage.get("input_tokens", 0), node=node, kind="prompt")
+        llm_tokens.inc(usage.get("output_tokens", 0), node=node, kind="completion")
+        return result
+
+    async def _hedged(self, node: str, input, config, kwargs):
+        """Send a duplicate request if the first one is slower than the node's p95"""
+        delay = None
+        if self.hedge:
+            delay = self.latency.percentile(node, 95, self.hedge_min_samples)
+        if delay is None:
+            return await self._call(node, input, config, kwargs)
+
+        primary = asyncio.ensure_future(self._call(node, input, config, kwargs))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and (self.quota is None or self.quota.try_acquire(input)):
+                self.hedges += 1
+                tasks.add(asyncio.ensure_future(self._call(node, input, config, kwargs)))
+
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def stats(self) -> dict:
+        """Return resilience counters and the breaker state"""
+        return {
+            "breaker": self.breaker.state,
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "timeouts": self.timeouts_hit,
+            "p95_seconds": {
+                node: round(self.latency.percentile(node, 95), 3)
+                for node in self.latency.nodes()
+            }
+        }
@@ -0,0 +1,55 @@
+import copy
+import hashlib
+import json
+
+
+# Sections enhanced independently: name -> True when the section is a list of entries
+ENHANCED_SECTIONS = {
+    "summary": False,
+    "experience": True,
+    "projects": True,
+    "skills": False
+}
+
+# Fields that identify a list entry; an enhanced entry must keep them
+ENTRY_IDENTITY_FIELDS = ("title", "company")
+
+
+def section_key(section: str, index: int = None) -> str:
+    """Stable key for one enhanceable part of a resume"""
+    return section if index is None else f"{section}:{index}"
+
+
+def section_fingerprint(section: str, content, version: str = "") -> str:
+    """Hash one section's content, independent of its position in the resume"""
+    payload = json.dumps([section, version, content], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def split_sections(resume: dict) -> list:
+    """Split a resume into (key, section, content) parts that can be enhanced independently"""
+    parts = []
+    for section, is_list in ENHANCED_SECTIONS.items():
+        value = resume.get(section)
+        if not value:
+            continue
+        if is_list:
+            for index, entry in enumerate(value):
+                parts.append((section_key(section, index), section, entry))
+        else:
+            parts.append((section_key(section), section, value))
+    return parts
+
+
+def merge_sections(resume: dict, enhanced: dict) -> dict:
+    """Return a copy of resume with enhanced parts (keyed by section_key) swapped in"""
+    merged = copy.deepcopy(resume)
+    for key, content in enhanced.items():
+        section, _, index = key.partition(":")
+        if index:
+            entries = merged.get(section) or []
+            if int(index) < len(entries):
+                entries[int(index)] = content
+        else:
+            merged[section] = content
+    return merged
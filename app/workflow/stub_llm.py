@@ -0,0 +1,109 @@
+import asyncio
+import json
+import re
+import time
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+
+CANNED_RESUME = {
+    "name": "Alex Morgan",
+    "email": "alex.morgan@example.com",
+    "phone": "+1 555 0100",
+    "linkedin": "linkedin.com/in/alexmorgan",
+    "summary": "Backend engineer with 6 years of experience building Python services on AWS.",
+    "experience": [
+        {
+            "title": "Senior Software Engineer",
+            "company": "Northwind",
+            "duration": "2021 - Present",
+            "description": "Led migration of 12 services to Kubernetes, cutting deploy time by 60%."
+        }
+    ],
+    "education": [
+        {"degree": "BSc", "field": "Computer Science", "institution": "State University", "year": "2018"}
+    ],
+    "skills": ["Python", "FastAPI", "AWS", "Docker", "Kubernetes", "PostgreSQL"],
+    "projects": [
+        {"title": "Resume Parser", "description": "Built an LLM pipeline that parses and scores resumes."}
+    ]
+}
+
+CANNED_ATS = {
+    "score": 72,
+    "feedback": "Solid structure; add more measurable outcomes and role keywords.",
+    "improvements": ["Quantify achievements", "Add a skills summary line"],
+    "missing_keywords": ["CI/CD", "Terraform"]
+}
+
+_JSON_AFTER = {
+    "resume": re.compile(r"Resume: (\{.*?\})\s*\n", re.DOTALL),
+    "section": re.compile(r"Section: (.*?)\s*\n\s*\n", re.DOTALL)
+}
+
+
+def _extract_json(pattern, text: str, default):
+    match = pattern.search(text)
+    if not match:
+        return default
+    try:
+        return json.loads(match.group(1))
+    except ValueError:
+        return default
+
+
+class StubChatModel(BaseChatModel):
+    """Deterministic offline chat model returning canned JSON for each workflow prompt
+
+    Parse prompts get a canned resume, ATS prompts a canned score and
+    enhancement prompts echo the resume or section they were given, so the
+    whole workflow runs without network access. ``latency_ms`` simulates
+    provider latency; ``responses`` overrides the canned parse/ats payloads.
+    """
+
+    latency_ms: int = 0
+    responses: dict = {}
+
+    @property
+    def _llm_type(self) -> str:
+        return "offline-stub"
+
+    def _respond(self, prompt: str) -> str:
+        resume = self.responses.get("parse", CANNED_RESUME)
+        ats = self.responses.get("ats", CANNED_ATS)
+        if "then improve it" in prompt:
+            payload = {
+                "ats_score": ats,
+                "enhanced_data": _extract_json(_JSON_AFTER["resume"], prompt, resume)
+            }
+        elif "Improve this part of a resume" in prompt:
+            payload = {"content": _extract_json(_JSON_AFTER["section"], prompt, "")}
+        elif "Improve this resume" in prompt:
+            payload = _extract_json(_JSON_AFTER["resume"], prompt, resume)
+        elif "ATS (Applicant Tracking System)" in prompt:
+            payload = ats
+        else:
+            payload = resume
+        return json.dumps(payload)
+
+    def _result(self, messages) -> ChatResult:
+        prompt = "\n".join(str(message.content) for message in messages)
+        content = self._respond(prompt)
+        prompt_tokens, completion_tokens = len(prompt) // 4, len(content) // 4
+        message = AIMessage(content=content, usage_metadata={
+            "input_tokens": prompt_tokens,
+            "output_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        })
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        return self._result(messages)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        return self._result(messages)
@@ -0,0 +1,138 @@
+"""Synthetic resume corpora for the benchmarks"""
+import io
+import random
+from docx import Document
+
+
+SIZES = {
+    # name: (experience entries, projects, bullet lines per entry)
+    "small": (2, 1, 3),
+    "medium": (6, 3, 5),
+    "large": (20, 8, 8)
+}
+
+# How many times the resume body is repeated in generated documents, so the
+# extraction benchmarks also cover long, many-page files
+DOCUMENT_REPEAT = {"small": 1, "medium": 2, "large": 6}
+
+_TITLES = ["Software Engineer", "Data Engineer", "Backend Developer", "Platform Engineer", "ML Engineer"]
+_COMPANIES = ["Northwind", "Contoso", "Initech", "Globex", "Umbrella", "Hooli", "Stark Industries"]
+_VERBS = ["Built", "Designed", "Migrated", "Optimized", "Led", "Automated", "Reduced", "Shipped"]
+_THINGS = [
+    "a Python data pipeline on AWS", "the FastAPI billing service", "Kubernetes deployments",
+    "CI/CD with GitHub Actions", "PostgreSQL query performance", "a React dashboard",
+    "Kafka event ingestion", "Terraform infrastructure modules", "an ML ranking model in PyTorch"
+]
+_SKILLS = [
+    "Python", "SQL", "AWS", "Docker", "Kubernetes", "FastAPI", "React", "PostgreSQL",
+    "Kafka", "Terraform", "PyTorch", "Airflow", "Redis", "TypeScript", "Linux"
+]
+
+
+def _bullets(rng: random.Random, count: int) -> str:
+    return "\n".join(
+        f"{rng.choice(_VERBS)} {rng.choice(_THINGS)}, improving throughput by {rng.randint(10, 90)}%"
+        for _ in range(count)
+    )
+
+
+def make_resume(size: str, seed: int = 0) -> dict:
+    """Build a deterministic structured resume of the given size"""
+    experience_count, project_count, bullet_count = SIZES[size]
+    rng = random.Random(f"{size}:{seed}")
+    return {
+        "name": "Jordan Example",
+        "email": "jordan@example.com",
+        "phone": "+1 555 0199",
+        "linkedin": "linkedin.com/in/jordan-example",
+        "summary": "Engineer focused on reliable backend systems and data platforms. " * 2,
+        "experience": [
+            {
+                "title": rng.choice(_TITLES),
+                "company": rng.choice(_COMPANIES),
+                "duration": f"{2024 - i - 1} - {2024 - i}",
+                "description": _bullets(rng, bullet_count)
+            }
+            for i in range(experience_count)
+        ],
+        "education": [
+            {"degree": "BSc", "field": "Computer Science", "institution": "State University", "year": "2015"}
+        ],
+        "skills": rng.sample(_SKILLS, 10),
+        "projects": [
+            {"title": f"Project {i + 1}", "description": _bullets(rng, 2)}
+            for i in range(project_count)
+        ]
+    }
+
+
+def resume_lines(resume: dict) -> list:
+    """Flatten a structured resume into the lines a document would contain"""
+    lines = [resume["name"], f"{resume['email']} | {resume['phone']} | {resume['linkedin']}", "",
+             "PROFESSIONAL SUMMARY", resume["summary"], "", "EXPERIENCE"]
+    for job in resume["experience"]:
+        lines.append(f"{job['title']} - {job['company']} ({job['duration']})")
+        lines.extend(job["description"].split("\n"))
+    lines += ["", "EDUCATION"]
+    for edu in resume["education"]:
+        lines.append(f"{edu['degree']} in {edu['field']}, {edu['institution']} ({edu['year']})")
+    lines += ["", "SKILLS", ", ".join(resume["skills"]), "", "PROJECTS"]
+    for project in resume["projects"]:
+        lines.append(project["title"])
+        lines.extend(project["description"].split("\n"))
+    return lines
+
+
+def make_text(size: str, seed: int = 0) -> str:
+    """Plain resume text as it would come out of the extractors"""
+    return "\n".join(resume_lines(make_resume(size, seed)))
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(size: str, seed: int = 0, lines_per_page: int = 40) -> bytes:
+    """Minimal multi-page text PDF (Helvetica, one text stream per page)"""
+    lines = resume_lines(make_resume(size, seed)) * DOCUMENT_REPEAT[size]
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+
+    objects = []
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{pid} 0 R" for pid in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for number, (page_id, page_lines) in enumerate(zip(page_ids, pages), start=1):
+        text = ["BT", "/F1 10 Tf", "14 TL", "50 780 Td"]
+        text += [f"({_pdf_escape(line)}) Tj T*" for line in page_lines + [f"Page {number}"]]
+        text.append("ET")
+        stream = "\n".join(text).encode("latin-1", "replace")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for i, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % i + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def make_docx(size: str, seed: int = 0) -> bytes:
+    """DOCX with one paragraph per resume line"""
+    doc = Document()
+    for line in resume_lines(make_resume(size, seed)) * DOCUMENT_REPEAT[size]:
+        doc.add_paragraph(line)
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
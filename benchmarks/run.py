@@ -0,0 +1,219 @@
+"""Component micro-benchmarks for the resume pipeline
+
+Times the extractors, the DOCX generator, every workflow node and the full
+compiled graph on synthetic corpora of several sizes, using the offline stub
+LLM so results are reproducible and need no network access.
+
+    python -m benchmarks.run --sizes small,medium,large --iterations 20 --output bench.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+# The benchmarks always run against the offline stub without caching, section
+# reuse or rate limits
+BENCH_ENV = {
+    "LLM_PROVIDER": "stub",
+    "LLM_CACHE_ENABLED": "false",
+    "EXTRACTION_CACHE_ENABLED": "false",
+    "INCREMENTAL_ENHANCE": "false",
+    "LLM_REQUESTS_PER_MINUTE": "0",
+    "LLM_TOKENS_PER_MINUTE": "0"
+}
+
+
+def _summary(samples: list) -> dict:
+    ordered = sorted(samples)
+    return {
+        "iterations": len(samples),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "min_ms": round(ordered[0], 3),
+        "max_ms": round(ordered[-1], 3)
+    }
+
+
+async def _measure(func, setup, iterations: int, warmup: int) -> list:
+    """Time ``func(setup())`` and return the samples in milliseconds
+
+    ``func`` may be sync or async; ``setup`` runs outside the timed region so
+    nodes that mutate their state always start from a fresh copy.
+    """
+    samples = []
+    for i in range(warmup + iterations):
+        arg = setup()
+        start = time.perf_counter()
+        result = func(arg)
+        if asyncio.iscoroutine(result):
+            await result
+        elapsed = (time.perf_counter() - start) * 1000
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def _cases(size: str):
+    """Yield (name, func, setup) for every benchmarked component"""
+    from app import config
+    from app.utils import extract_text_from_pdf, extract_text_from_docx, render_resume_docx, save_resume_docx
+    from app.workflow import (
+        compact_text_node,
+        parse_resume_node,
+        ats_score_node,
+        enhance_resume_node,
+        ats_enhance_node,
+        enhance_section_node,
+        merge_sections_node,
+        generate_resume_node,
+        build_workflow
+    )
+    from app.utils.ats_scorer import score_resume
+    from app.workflow.sections import split_sections
+    from .corpus import make_docx, make_pdf, make_resume, make_text
+
+    resume = make_resume(size)
+    text = make_text(size)
+    pdf = make_pdf(size)
+    docx = make_docx(size)
+    ats = score_resume(resume)
+    section_key, section, content = split_sections(resume)[1]
+    graph = build_workflow()
+    fused_graph = build_workflow(fused=True)
+
+    def state(**extra):
+        return lambda: {
+            "raw_text": text,
+            "parsed_data": json.loads(json.dumps(resume)),
+            "ats_score": ats,
+            "enhanced_data": {},
+            "template": "modern",
+            "output_file": "",
+            "job_description": "",
+            "compaction": {},
+            "enhanced_sections": {},
+            **extra
+        }
+
+    async def ats_llm(s):
+        config.ATS_SCORER = "llm"
+        try:
+            return await ats_score_node(s)
+        finally:
+            config.ATS_SCORER = "local"
+
+    yield "extract_text_from_pdf", extract_text_from_pdf, lambda: pdf
+    yield "extract_text_from_docx", extract_text_from_docx, lambda: docx
+    yield "save_resume_docx", save_resume_docx, lambda: resume
+    yield "render_resume_docx", render_resume_docx, lambda: resume
+    yield "node.compact", compact_text_node, state()
+    yield "node.parse", parse_resume_node, state()
+    yield "node.ats_score.local", ats_score_node, state()
+    yield "node.ats_score.llm", ats_llm, state()
+    yield "node.enhance", enhance_resume_node, state()
+    yield "node.enhance_section", enhance_section_node, lambda: {
+        "key": section_key, "section": section, "content": content, "missing_keywords": []
+    }
+    yield "node.merge_sections", merge_sections_node, state(enhanced_sections={section_key: content})
+    yield "node.ats_enhance", ats_enhance_node, state()
+    yield "node.generate", generate_resume_node, state(enhanced_data=resume)
+    yield "graph.full", graph.ainvoke, state(parsed_data={}, ats_score={})
+    yield "graph.full.fused", fused_graph.ainvoke, state(parsed_data={}, ats_score={})
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+async def run(sizes: list, iterations: int, warmup: int, only: str = "") -> list:
+    from .corpus import DOCUMENT_REPEAT, SIZES
+
+    from app.utils.extraction_cache import extraction_cache
+    from app.workflow.llm_cache import llm_cache, section_cache
+
+    results = []
+    try:
+        for size in sizes:
+            for name, func, setup in _cases(size):
+                if only and only not in name:
+                    continue
+                samples = await _measure(func, setup, iterations, warmup)
+                experience, projects, bullets = SIZES[size]
+                results.append({
+                    "name": name,
+                    "size": size,
+                    "experience_entries": experience,
+                    "document_repeat": DOCUMENT_REPEAT[size],
+                    **_summary(samples)
+                })
+                print(f"{name:28} {size:7} mean {results[-1]['mean_ms']:9.3f} ms  "
+                      f"p95 {results[-1]['p95_ms']:9.3f} ms", file=sys.stderr)
+    finally:
+        # Open cache connections run on non-daemon threads that would keep the process alive
+        for cache in (llm_cache, section_cache, extraction_cache):
+            await cache.close()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="small,medium,large", help="comma separated corpus sizes")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--stub-latency-ms", type=int, default=0, help="simulated LLM latency")
+    parser.add_argument("--only", default="", help="run only benchmarks whose name contains this")
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args(argv)
+
+    os.environ.update(BENCH_ENV)
+    os.environ["STUB_LLM_LATENCY_MS"] = str(args.stub_latency_ms)
+    output = os.path.abspath(args.output)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    # Generated DOCX files land in a scratch directory; the API module mounts
+    # ./static at import time, so the scratch directory provides one
+    workdir = tempfile.mkdtemp(prefix="resume-bench-")
+    os.makedirs(os.path.join(workdir, "static"), exist_ok=True)
+    os.chdir(workdir)
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    started = time.perf_counter()
+    results = asyncio.run(run(sizes, args.iterations, args.warmup, args.only))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "llm_provider": "stub",
+            "stub_latency_ms": args.stub_latency_ms,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "total_seconds": round(time.perf_counter() - started, 3)
+        },
+        "results": results
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
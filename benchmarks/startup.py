@@ -0,0 +1,128 @@
+"""Cold-start report for the API process
+
+Imports a module in fresh interpreters with ``-X importtime`` and reports the
+wall time of the import plus a breakdown of what it pulled in, grouped by
+top-level package:
+
+    python -m benchmarks.startup --module app.routes.api --runs 5 --output startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _parse_importtime(stderr: str) -> list:
+    """Turn ``-X importtime`` output into (depth, self_us, cumulative_us, name) rows"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((depth, int(parts[0]), int(parts[1]), name.strip()))
+    return rows
+
+
+def _children(rows: list, module: str) -> tuple:
+    """Cumulative time of ``module`` and of each import it triggered directly
+
+    Rows are printed children-first, so the direct children of a row are the
+    rows one level deeper that precede it after its previous sibling.
+    """
+    target = None
+    for index, (depth, _, cumulative, name) in enumerate(rows):
+        if name == module and (target is None or depth >= rows[target][0]):
+            target = index
+    if target is None:
+        return 0, {}
+
+    depth = rows[target][0]
+    children = {}
+    for child_depth, _, cumulative, name in reversed(rows[:target]):
+        if child_depth <= depth:
+            break
+        if child_depth == depth + 1:
+            package = name.split(".")[0]
+            children[package] = children.get(package, 0) + cumulative
+    return rows[target][2], children
+
+
+def measure(module: str) -> dict:
+    """Import ``module`` once in a fresh interpreter"""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; "
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.setdefault("GROQ_API_KEY", "unused")
+    # The API module mounts ./static at import time
+    workdir = tempfile.mkdtemp(prefix="resume-startup-")
+    os.makedirs(os.path.join(workdir, "static"))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=workdir, env=env
+    )
+    if result.returncode != 0:
+        raise Exception(result.stderr.strip().splitlines()[-1])
+
+    rows = _parse_importtime(result.stderr)
+    module_us, children = _children(rows, module)
+    return {
+        "wall_ms": float(result.stdout.strip().splitlines()[-1]),
+        "module_ms": module_us / 1000,
+        "modules_imported": len(rows),
+        "children_ms": {name: us / 1000 for name, us in children.items()}
+    }
+
+
+def report(module: str, runs: int, top: int) -> dict:
+    """Median of several cold imports; the first run also primes bytecode caches"""
+    measure(module)
+    samples = [measure(module) for _ in range(runs)]
+    packages = {}
+    for sample in samples:
+        for name, ms in sample["children_ms"].items():
+            packages.setdefault(name, []).append(ms)
+    ranked = sorted(
+        ((name, statistics.median(values)) for name, values in packages.items()),
+        key=lambda item: -item[1]
+    )
+    return {
+        "module": module,
+        "runs": runs,
+        "wall_ms": round(statistics.median(s["wall_ms"] for s in samples), 1),
+        "module_ms": round(statistics.median(s["module_ms"] for s in samples), 1),
+        "modules_imported": samples[-1]["modules_imported"],
+        "imports": {name: round(ms, 1) for name, ms in ranked[:top]}
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start import report")
+    parser.add_argument("--module", default="app.routes.api")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", default="")
+    args = parser.parse_args(argv)
+
+    result = report(args.module, args.runs, args.top)
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
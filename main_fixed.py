@@ -4,9 +4,12 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, List
+import asyncio
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 import PyPDF2
 from docx import Document
 from dotenv import load_dotenv
@@ -56,6 +59,15 @@ class ResumeState(TypedDict):
 
 # ==================== UTILITY FUNCTIONS ====================
 
+# Bounded pool for CPU-bound work and a cap on in-flight workflows
+worker_pool = ThreadPoolExecutor(max_workers=int(os.getenv("WORKER_POOL_SIZE", "8")))
+workflow_slots = asyncio.Semaphore(int(os.getenv("MAX_INFLIGHT_WORKFLOWS", "16")))
+
+async def run_in_worker(func, *args, **kwargs):
+    """Run a blocking function on the bounded worker pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(worker_pool, partial(func, *args, **kwargs))
+
 def extract_text_from_pdf(file_path: str) -> str:
     """Extract text from PDF file"""
     text = ""
@@ -145,7 +157,7 @@ def save_resume_docx(data: dict, template: str = "modern") -> str:
 llm = ChatGroq(model="llama-3.1-8b-instant", temperature=0.2)
 
 # -------- Node: Parse Resume --------
-def parse_resume_node(state: ResumeState) -> ResumeState:
+async def parse_resume_node(state: ResumeState) -> ResumeState:
     """Parse raw resume text into structured data"""
     
     # Add validation for empty text
@@ -183,7 +195,7 @@ def parse_resume_node(state: ResumeState) -> ResumeState:
     chain = prompt | llm | parser
     
     try:
-        parsed_data = chain.invoke({"resume_text": state["raw_text"]})
+        parsed_data = await chain.ainvoke({"resume_text": state["raw_text"]})
     except OutputParserException as e:
         raise Exception(f"Failed to parse resume as JSON: {str(e)}")
     
@@ -191,7 +203,7 @@ def parse_resume_node(state: ResumeState) -> ResumeState:
     return state
 
 # -------- Node: Calculate ATS Score --------
-def ats_score_node(state: ResumeState) -> ResumeState:
+async def ats_score_node(state: ResumeState) -> ResumeState:
     """Calculate ATS score for resume"""
     prompt = PromptTemplate(
         input_variables=["resume_data"],
@@ -213,7 +225,7 @@ def ats_score_node(state: ResumeState) -> ResumeState:
     chain = prompt | llm | parser
     
     try:
-        ats_data = chain.invoke({"resume_data": json.dumps(state["parsed_data"])})
+        ats_data = await chain.ainvoke({"resume_data": json.dumps(state["parsed_data"])})
     except OutputParserException as e:
         ats_data = {
             "score": 0,
@@ -226,7 +238,7 @@ def ats_score_node(state: ResumeState) -> ResumeState:
     return state
 
 # -------- Node: Enhance Resume --------
-def enhance_resume_node(state: ResumeState) -> ResumeState:
+async def enhance_resume_node(state: ResumeState) -> ResumeState:
     """Enhance resume with AI improvements"""
     prompt = PromptTemplate(
         input_variables=["resume_data", "ats_feedback"],
@@ -260,7 +272,7 @@ def enhance_resume_node(state: ResumeState) -> ResumeState:
     chain = prompt | llm | parser
     
     try:
-        enhanced_data = chain.invoke({
+        enhanced_data = await chain.ainvoke({
             "resume_data": json.dumps(state["parsed_data"]),
             "ats_feedback": json.dumps(state["ats_score"])
         })
@@ -271,13 +283,13 @@ def enhance_resume_node(state: ResumeState) -> ResumeState:
     return state
 
 # -------- Node: Generate Resume --------
-def generate_resume_node(state: ResumeState) -> ResumeState:
+async def generate_resume_node(state: ResumeState) -> ResumeState:
     """Generate final resume file"""
    
     resume_data = state.get("enhanced_data") or state.get("parsed_data")
     template = state.get("template", "modern")
     
-    filepath = save_resume_docx(resume_data, template)
+    filepath = await run_in_worker(save_resume_docx, resume_data, template)
     state["output_file"] = filepath
     return state
 
@@ -320,9 +332,9 @@ async def upload_resume(file: UploadFile = File(...)):
         
        
         if file.filename.endswith(".pdf"):
-            raw_text = extract_text_from_pdf(filepath)
+            raw_text = await run_in_worker(extract_text_from_pdf, filepath)
         elif file.filename.endswith(".docx"):
-            raw_text = extract_text_from_docx(filepath)
+            raw_text = await run_in_worker(extract_text_from_docx, filepath)
         else:
             return JSONResponse({"error": "Unsupported file format"}, status_code=400)
         
@@ -336,7 +348,8 @@ async def upload_resume(file: UploadFile = File(...)):
             "output_file": ""
         }
         
-        result = graph.invoke(initial_state)
+        async with workflow_slots:
+            result = await graph.ainvoke(initial_state)
         
         # Extract just the filename from the full path
         output_filename = os.path.basename(result["output_file"])
@@ -377,7 +390,8 @@ async def process_manual_resume(data: ResumeData):
             "output_file": ""
         }
         
-        result = graph.invoke(initial_state)
+        async with workflow_slots:
+            result = await graph.ainvoke(initial_state)
         
         output_filename = os.path.basename(result["output_file"])
         
@@ -407,7 +421,8 @@ async def enhance_resume(data: dict):
         }
         
         # Run from ats_score onwards
-        result = graph.invoke(initial_state)
+        async with workflow_slots:
+            result = await graph.ainvoke(initial_state)
         
         return JSONResponse({
             "status": "success",